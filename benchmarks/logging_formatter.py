@@ -0,0 +1,67 @@
+"""
+Сравнение скорости CustomJsonFormatter с прежней реализацией
+
+Запуск:
+    python -m benchmarks.logging_formatter
+"""
+
+__author__: str = "Старков Е.П."
+
+import json
+import logging
+import timeit
+
+from pythonjsonlogger.json import JsonFormatter
+
+from dh_platform.logging import CustomJsonFormatter
+from dh_platform.logging.consts import LOG_CONFIG
+
+NUMBER: int = 50000
+
+
+class LegacyJsonFormatter(JsonFormatter):
+    """Прежняя реализация форматтера"""
+
+    def process_log_record(self, log_record):
+        for key, value in log_record.items():
+            if isinstance(value, str):
+                log_record[key] = value.encode("utf-8").decode("utf-8")
+        return super().process_log_record(log_record)
+
+
+def make_formatter(formatter_class: type, **kwargs) -> logging.Formatter:
+    config: dict = {key: value for key, value in LOG_CONFIG["formatters"]["json"].items() if key != "()"}
+    return formatter_class(config.pop("format"), **config, **kwargs)
+
+
+def make_record(with_extra: bool) -> logging.LogRecord:
+    record: logging.LogRecord = logging.LogRecord(
+        "dh_logger", logging.INFO, __file__, 1, "Пользователь %s создан", ("Иванов",), None
+    )
+
+    if with_extra:
+        record.__dict__.update({"request_id": "4f1c2a", "user_id": 42, "path": "/api/users"})
+
+    return record
+
+
+def main() -> None:
+    formatters: dict[str, logging.Formatter] = {
+        "legacy": make_formatter(LegacyJsonFormatter),
+        "custom (json)": make_formatter(CustomJsonFormatter, fast_json=False),
+        "custom (orjson)": make_formatter(CustomJsonFormatter),
+    }
+
+    for with_extra in (False, True):
+        record: logging.LogRecord = make_record(with_extra)
+        expected: dict = json.loads(formatters["legacy"].format(record))
+        print(f"Запись {'с дополнительными полями' if with_extra else 'без дополнительных полей'}:")
+
+        for name, formatter in formatters.items():
+            assert json.loads(formatter.format(record)) == expected, name
+            seconds: float = min(timeit.repeat(lambda: formatter.format(record), number=NUMBER, repeat=5))
+            print(f"  {name:<16} {seconds / NUMBER * 1e6:8.2f} мкс/запись")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""
+Сравнение скорости сериализации моделей: прежний to_dict, новый сериализатор и преобразование в схемы
+
+Запуск:
+    python -m benchmarks.model_serialization
+"""
+
+__author__: str = "Старков Е.П."
+
+import timeit
+from datetime import datetime
+from typing import Any, Callable
+
+from pydantic import BaseModel as Schema
+from sqlalchemy import String, create_engine, insert, select
+from sqlalchemy.orm import Mapped, Session, mapped_column
+
+from dh_platform.models import (
+    BaseModel,
+    IDMixin,
+    SoftDeleteMixin,
+    TimestampMixin,
+)
+
+ROWS: int = 10000
+
+
+class BenchUser(BaseModel, IDMixin, SoftDeleteMixin, TimestampMixin):
+    """Модель для замера"""
+
+    name: Mapped[str] = mapped_column(String(100))
+    email: Mapped[str] = mapped_column(String(100))
+    age: Mapped[int | None]
+
+
+class BenchUserOut(Schema):
+    """Схема ответа"""
+
+    id: int
+    name: str
+    email: str
+    age: int | None
+    created_at: datetime | None
+    updated_at: datetime | None
+    deleted_at: datetime | None
+
+
+def legacy_to_dict(instance: BaseModel) -> dict[str, Any]:
+    """Прежняя реализация BaseModel.to_dict"""
+    return {column.name: getattr(instance, column.name) for column in instance.__table__.columns}
+
+
+def measure(name: str, func: Callable[[], Any]) -> None:
+    seconds: float = min(timeit.repeat(func, number=1, repeat=5))
+    print(f"  {name:<44} {seconds / ROWS * 1e6:8.3f} мкс/запись")
+
+
+def main() -> None:
+    engine = create_engine("sqlite://")
+    BaseModel.metadata.create_all(engine, tables=[BenchUser.__table__])
+
+    with Session(engine) as session:
+        session.execute(
+            insert(BenchUser),
+            [{"name": f"Пользователь {i}", "email": f"user{i}@example.com", "age": i % 90} for i in range(ROWS)],
+        )
+        session.commit()
+        users: list[BenchUser] = list(session.scalars(select(BenchUser)))
+        rows: list[Any] = list(session.execute(select(BenchUser.__table__)))
+
+    assert [legacy_to_dict(user) for user in users] == BenchUser.to_dicts(users) == BenchUser.to_dicts(rows)
+
+    print("Словари:")
+    measure("прежний to_dict", lambda: [legacy_to_dict(user) for user in users])
+    measure("to_dict", lambda: [user.to_dict() for user in users])
+    measure("to_dicts (экземпляры модели)", lambda: BenchUser.to_dicts(users))
+    measure("to_dicts (строки select(__table__))", lambda: BenchUser.to_dicts(rows))
+
+    print("Схемы:")
+    measure(
+        "model_validate по записи",
+        lambda: [BenchUserOut.model_validate(user, from_attributes=True) for user in users],
+    )
+    measure("model_validate(to_dict())", lambda: [BenchUserOut.model_validate(legacy_to_dict(user)) for user in users])
+    measure("to_schema (экземпляры модели)", lambda: BenchUser.to_schema(users, BenchUserOut))
+    measure("to_schema (строки select(__table__))", lambda: BenchUser.to_schema(rows, BenchUserOut))
+
+
+if __name__ == "__main__":
+    main()
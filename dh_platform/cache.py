@@ -0,0 +1,222 @@
+"""Модуль кэширования сущностей"""
+
+__author__: str = "Старков Е.П."
+
+import asyncio
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Hashable
+
+# Признак отсутствия значения в кэше. None - допустимое значение
+MISSING: Any = object()
+
+
+class _LoadCancelled(Exception):
+    """Загрузка значения отменена вместе с вызвавшим ее кодом. Ожидающие вызовы повторяют загрузку"""
+
+
+class CacheBackend(ABC):
+    """
+    Интерфейс хранилища кэша.
+    Реализация для внешнего хранилища (например, Redis) отвечает за сериализацию значений
+
+    Examples:
+        >>> class RedisCache(CacheBackend):
+        ...     async def get(self, key):
+        ...         raw = await redis.get(self._make_key(key))
+        ...         return MISSING if raw is None else self._load(raw)
+        ...     ...
+    """
+
+    @abstractmethod
+    async def get(self, key: Hashable) -> Any:
+        """
+        Получение значения
+
+        Args:
+            key (Hashable): Ключ
+
+        Returns:
+            Значение или MISSING, если значения нет
+        """
+
+    @abstractmethod
+    async def set(self, key: Hashable, value: Any, ttl: float | None = None) -> None:
+        """
+        Запись значения
+
+        Args:
+            key (Hashable): Ключ
+            value (Any): Значение
+            ttl (float | None): Время жизни, секунды. None - без ограничения
+        """
+
+    @abstractmethod
+    async def delete(self, *keys: Hashable) -> None:
+        """
+        Удаление значений
+
+        Args:
+            keys (Hashable): Ключи
+        """
+
+    @abstractmethod
+    async def clear(self) -> None:
+        """Очистка хранилища"""
+
+
+class MemoryCache(CacheBackend):
+    """
+    Кэш в памяти процесса с ограничением по времени жизни и вытеснением давно неиспользуемых записей
+
+    Args:
+        max_size (int): Максимальное количество записей
+    """
+
+    def __init__(self, max_size: int = 1024) -> None:
+        self._max_size: int = max_size
+        self._data: OrderedDict[Hashable, tuple[Any, float | None]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    async def get(self, key: Hashable) -> Any:
+        item: tuple[Any, float | None] | None = self._data.get(key)
+
+        if item is None:
+            return MISSING
+
+        value, expires_at = item
+
+        if expires_at is not None and expires_at <= time.monotonic():
+            del self._data[key]
+            return MISSING
+
+        self._data.move_to_end(key)
+
+        return value
+
+    async def set(self, key: Hashable, value: Any, ttl: float | None = None) -> None:
+        self._data[key] = (value, time.monotonic() + ttl if ttl is not None else None)
+        self._data.move_to_end(key)
+
+        while len(self._data) > self._max_size:
+            self._data.popitem(last=False)
+
+    async def delete(self, *keys: Hashable) -> None:
+        for key in keys:
+            self._data.pop(key, None)
+
+    async def clear(self) -> None:
+        self._data.clear()
+
+
+class EntityCache:
+    """
+    Кэш сущностей сервиса.
+    При одновременных промахах по одному ключу запрос в БД выполняется один раз, остальные вызовы
+    ожидают его результат. Если загружающий вызов отменен, загрузку выполняет один из ожидающих.
+    Загрузка, начатая до сброса ключа, не записывает прочитанное значение в кэш
+
+    Args:
+        backend (CacheBackend | None): Хранилище. По-умолчанию - MemoryCache
+        ttl (float | None): Время жизни записи, секунды
+
+    Attributes:
+        hits (int): Количество попаданий
+        misses (int): Количество промахов
+
+    Examples:
+        >>> from dh_platform.cache import EntityCache, MemoryCache
+        >>>
+        >>> class CountryService(BaseService):
+        ...     _MODEL = Country
+        ...     _CACHE = EntityCache(MemoryCache(max_size=500), ttl=300)
+        >>>
+        >>> CountryService._CACHE.stats
+        {'hits': 10, 'misses': 2}
+    """
+
+    def __init__(self, backend: CacheBackend | None = None, ttl: float | None = 60) -> None:
+        self.backend: CacheBackend = backend or MemoryCache()
+        self.ttl: float | None = ttl
+        self.hits: int = 0
+        self.misses: int = 0
+        self._inflight: dict[Hashable, asyncio.Future] = {}
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """Счетчики попаданий и промахов"""
+        return {"hits": self.hits, "misses": self.misses}
+
+    async def get_or_load(self, key: Hashable, loader: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Получение значения из кэша или загрузка с записью в кэш.
+        Значение None не кэшируется
+
+        Args:
+            key (Hashable): Ключ
+            loader (Callable[[], Awaitable[Any]]): Загрузка значения при промахе
+
+        Returns:
+            Значение
+        """
+        value: Any = await self.backend.get(key)
+
+        if value is not MISSING:
+            self.hits += 1
+            return value
+
+        self.misses += 1
+
+        while (inflight := self._inflight.get(key)) is not None:
+            try:
+                return await asyncio.shield(inflight)
+            except _LoadCancelled:
+                continue
+
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+
+        try:
+            value = await loader()
+
+            # После сброса ключа загрузка могла прочитать прежние данные
+            if value is not None and self._inflight.get(key) is future:
+                await self.backend.set(key, value, self.ttl)
+        except asyncio.CancelledError:
+            # Отмена future отменила бы и ожидающих, поэтому они получают исключение для повтора
+            future.set_exception(_LoadCancelled())
+            future.exception()
+            raise
+        except Exception as ex:
+            future.set_exception(ex)
+            # Исключение получит вызывающий код, ожидающих может не быть
+            future.exception()
+            raise
+        else:
+            future.set_result(value)
+        finally:
+            if self._inflight.get(key) is future:
+                del self._inflight[key]
+
+        return value
+
+    async def invalidate(self, *keys: Hashable) -> None:
+        """
+        Удаление значений из кэша. Выполняемые загрузки ключей не записывают результат,
+        следующие вызовы загружают значения заново
+
+        Args:
+            keys (Hashable): Ключи
+        """
+        for key in keys:
+            self._inflight.pop(key, None)
+
+        if keys:
+            await self.backend.delete(*keys)
+
+    async def clear(self) -> None:
+        """Очистка кэша"""
+        await self.backend.clear()
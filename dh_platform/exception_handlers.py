@@ -0,0 +1,152 @@
+"""Модуль обработчиков исключений FastAPI"""
+
+__author__: str = "Старков Е.П."
+
+import logging
+import time
+from typing import Hashable
+
+from fastapi import FastAPI, Request, Response, status
+from fastapi.exception_handlers import http_exception_handler
+
+from dh_platform.exceptions import BaseAppException
+from dh_platform.metrics import metrics
+
+logger = logging.getLogger("dh_logger")
+
+app_exceptions = metrics.counter("dh_app_exceptions_total", "Исключения приложения", ["exception", "status"])
+app_exceptions_suppressed = metrics.counter(
+    "dh_app_exceptions_suppressed_total", "Исключения, не записанные в лог из-за ограничения частоты", ["exception"]
+)
+
+
+class ExceptionLogLimiter:
+    """
+    Ограничение частоты записи одинаковых исключений в лог.
+    Одинаковыми считаются исключения одного класса с одним кодом и сообщением. В окне window секунд
+    записываются первые limit исключений, остальные подсчитываются, и их количество выводится
+    со следующей записью
+
+    Args:
+        window (float): Длительность окна, секунды
+        limit (int): Количество записей одного исключения в окне
+        max_keys (int): Максимум отслеживаемых исключений. При превышении счетчики сбрасываются
+
+    Attributes:
+        suppressed (int): Всего не записанных исключений
+    """
+
+    def __init__(self, window: float = 60, limit: int = 5, max_keys: int = 1024) -> None:
+        self.window: float = window
+        self.limit: int = limit
+        self.max_keys: int = max_keys
+        self.suppressed: int = 0
+        # Ключ исключения -> [начало окна, записано в окне, пропущено в окне]
+        self._windows: dict[Hashable, list[float]] = {}
+
+    def acquire(self, key: Hashable) -> int | None:
+        """
+        Проверка, можно ли записать исключение в лог
+
+        Args:
+            key (Hashable): Ключ исключения
+
+        Returns:
+            (int | None): None - запись не нужна, иначе количество пропущенных в прошлом окне исключений
+        """
+        now: float = time.monotonic()
+        state: list[float] | None = self._windows.get(key)
+
+        if state is None or now - state[0] >= self.window:
+            if state is None and len(self._windows) >= self.max_keys:
+                self._windows.clear()
+
+            skipped: int = int(state[2]) if state else 0
+            self._windows[key] = [now, 1, 0]
+            return skipped
+
+        if state[1] < self.limit:
+            state[1] += 1
+            return 0
+
+        state[2] += 1
+        self.suppressed += 1
+
+        return None
+
+
+exception_log_limiter: ExceptionLogLimiter = ExceptionLogLimiter()
+
+
+def log_app_exception(exc: BaseAppException, request: Request | None = None) -> None:
+    """
+    Запись исключения приложения в лог с уровнем исключения и ограничением частоты.
+    Стек вызовов записывается только для кодов 5xx
+
+    Args:
+        exc (BaseAppException): Исключение
+        request (Request | None): Запрос, при обработке которого возникло исключение
+    """
+    name: str = type(exc).__name__
+
+    if metrics.enabled:
+        app_exceptions.labels(name, str(exc.status_code)).inc()
+
+    level: int = exc.log_level
+
+    if not logger.isEnabledFor(level):
+        return
+
+    skipped: int | None = exception_log_limiter.acquire((type(exc), exc.status_code, exc.detail))
+
+    if skipped is None:
+        if metrics.enabled:
+            app_exceptions_suppressed.labels(name).inc()
+        return
+
+    is_server_error: bool = exc.status_code >= status.HTTP_500_INTERNAL_SERVER_ERROR
+    logger.log(
+        level,
+        "Исключение DH: %s [%d]%s",
+        exc.detail,
+        exc.status_code,
+        f" (пропущено повторов: {skipped})" if skipped else "",
+        exc_info=exc if is_server_error else None,
+        extra={
+            "exception": name,
+            "http_status": exc.status_code,
+            "http_path": request.url.path if request is not None else None,
+        },
+    )
+
+
+async def app_exception_handler(request: Request, exc: BaseAppException) -> Response:
+    """
+    Обработчик исключений приложения: запись в лог и ответ с кодом и сообщением исключения
+
+    Args:
+        request (Request): Запрос
+        exc (BaseAppException): Исключение
+
+    Returns:
+        (Response): Ответ
+    """
+    log_app_exception(exc, request)
+
+    return await http_exception_handler(request, exc)
+
+
+def register_exception_handlers(app: FastAPI) -> None:
+    """
+    Регистрация обработчиков исключений платформы
+
+    Args:
+        app (FastAPI): Приложение
+
+    Examples:
+        >>> from dh_platform.exception_handlers import register_exception_handlers
+        >>>
+        >>> app: FastAPI = FastAPI(lifespan=lifespan)
+        >>> register_exception_handlers(app)
+    """
+    app.add_exception_handler(BaseAppException, app_exception_handler)  # type: ignore[arg-type]
@@ -8,18 +8,20 @@ from fastapi import HTTPException, status
 
 from .types import DictOrNone
 
-logger = logging.getLogger("dh_logger")
-
 
 class BaseAppException(HTTPException):
     """
     Базовый класс исключений.
-    Используется для расширения конкретным исключением приложения
+    Используется для расширения конкретным исключением приложения.
+    Исключение не логируется при создании: запись в лог делает обработчик исключений FastAPI
+    (dh_platform.exception_handlers.register_exception_handlers)
 
     Attributes:
         _DETAIL (str): Текст сообщения ошибки
         _CODE (int): HTTP код ошибки. По-умолчанию - HTTP_500_INTERNAL_SERVER_ERROR
+        _LOG_LEVEL (int | None): Уровень записи в лог. По-умолчанию - ERROR для кодов 5xx, INFO для остальных
     Examples:
+        >>> import logging
         >>> from fastapi import status
         >>> from dh_platform.exceptions import BaseAppException
         >>>
@@ -27,10 +29,12 @@ class BaseAppException(HTTPException):
         >>> class EntityNotFound(BaseAppException):
         ...     _DETAIL = "Сущность не найдена"
         ...     _CODE = status.HTTP_404_NOT_FOUND
+        ...     _LOG_LEVEL = logging.DEBUG
     """
 
     _DETAIL: str
     _CODE: int = status.HTTP_500_INTERNAL_SERVER_ERROR
+    _LOG_LEVEL: int | None = None
 
     def __init__(self, detail: str | None = None, status_code: int | None = None, headers: DictOrNone = None) -> None:
         """
@@ -42,15 +46,42 @@ class BaseAppException(HTTPException):
             headers (dict | None): заголовки
         """
         super().__init__(status_code or self._CODE, detail or self._DETAIL, headers)
-        logger.exception("Исключение DH: %s [%d]", (detail or self._DETAIL), (status_code or self._CODE))
 
+    @property
+    def log_level(self) -> int:
+        """Уровень записи исключения в лог"""
+        if self._LOG_LEVEL is not None:
+            return self._LOG_LEVEL
+
+        return logging.ERROR if self.status_code >= status.HTTP_500_INTERNAL_SERVER_ERROR else logging.INFO
 
 
 class EntityNotFound(BaseAppException):
     _DETAIL = "Запись по переданному идентификатору не была найдена"
-    _СODE = status.HTTP_404_NOT_FOUND
+    _CODE = status.HTTP_404_NOT_FOUND
+    _LOG_LEVEL = logging.DEBUG
 
 
 class UpdateAllowedById(BaseAppException):
     _DETAIL = "Для обновление записи в данных должно быть поле с идентификатором"
-    _CODE = status.HTTP_400_BAD_REQUEST
\ No newline at end of file
+    _CODE = status.HTTP_400_BAD_REQUEST
+
+
+class InvalidNavigation(BaseAppException):
+    _DETAIL = "Переданы некорректные параметры навигации"
+    _CODE = status.HTTP_400_BAD_REQUEST
+
+
+class EntityVersionConflict(BaseAppException):
+    _DETAIL = "Запись была изменена другим запросом. Обновите данные и повторите операцию"
+    _CODE = status.HTTP_409_CONFLICT
+
+
+class InvalidFilter(BaseAppException):
+    _DETAIL = "Переданы некорректные параметры фильтрации"
+    _CODE = status.HTTP_400_BAD_REQUEST
+
+
+class InvalidFields(BaseAppException):
+    _DETAIL = "Переданы некорректные поля выборки"
+    _CODE = status.HTTP_400_BAD_REQUEST
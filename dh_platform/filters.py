@@ -0,0 +1,185 @@
+"""Модуль фильтрации списков"""
+
+__author__: str = "Старков Е.П."
+
+from functools import lru_cache
+from typing import Any, Callable, Mapping, NamedTuple, Type
+
+from sqlalchemy import Column, ColumnElement, Select, inspect
+from sqlalchemy.exc import ArgumentError
+
+from dh_platform.exceptions import InvalidFilter
+
+# Разделитель поля и оператора в ключе фильтра: {"age__gte": 18}
+SEPARATOR: str = "__"
+
+
+def _range(column: Column, value: Any) -> ColumnElement:
+    if not isinstance(value, (list, tuple)) or len(value) != 2:
+        raise ValueError("Диапазон должен быть парой значений")
+
+    low, high = value
+
+    if low is None:
+        return column <= high
+
+    if high is None:
+        return column >= low
+
+    return column.between(low, high)
+
+
+def _values(value: Any) -> Any:
+    if not isinstance(value, (list, tuple, set, frozenset)):
+        raise ValueError("Значение должно быть списком")
+
+    return value
+
+
+def _is_null(column: Column, value: Any) -> ColumnElement:
+    return column.is_(None) if value else column.is_not(None)
+
+
+# Операторы фильтра. Все выражения строятся со связанными параметрами, поэтому запросы одной формы
+# переиспользуют скомпилированный SQL из кэша SQLAlchemy
+OPERATORS: dict[str, Callable[[Column, Any], ColumnElement]] = {
+    "eq": lambda column, value: column == value,
+    "ne": lambda column, value: column != value,
+    "gt": lambda column, value: column > value,
+    "gte": lambda column, value: column >= value,
+    "lt": lambda column, value: column < value,
+    "lte": lambda column, value: column <= value,
+    "in": lambda column, value: column.in_(_values(value)),
+    "not_in": lambda column, value: column.not_in(_values(value)),
+    "range": _range,
+    "like": lambda column, value: column.like(value),
+    "ilike": lambda column, value: column.ilike(value),
+    "is_null": _is_null,
+}
+
+
+class CompiledFilter(NamedTuple):
+    """
+    Скомпилированное условие фильтра
+
+    Attributes:
+        key (str): Ключ фильтра
+        column (Column): Колонка модели
+        operator (Callable[[Column, Any], ColumnElement]): Оператор
+    """
+
+    key: str
+    column: Column
+    operator: Callable[[Column, Any], ColumnElement]
+
+    def to_clause(self, value: Any) -> ColumnElement:
+        """
+        Построение условия по значению фильтра
+
+        Args:
+            value (Any): Значение фильтра
+
+        Returns:
+            (ColumnElement): Условие
+
+        Raises:
+            InvalidFilter: Значение не подходит для оператора
+        """
+        try:
+            return self.operator(self.column, value)
+        except (ValueError, TypeError, ArgumentError) as ex:
+            raise InvalidFilter(detail=f"Некорректное значение фильтра {self.key}") from ex
+
+
+class FilterCompiler:
+    """
+    Компилятор фильтров модели.
+    Разбор ключей фильтра и поиск колонок выполняются один раз на форму фильтра (набор ключей),
+    повторные запросы той же формы только подставляют значения
+
+    Args:
+        model (Type): Модель сущности
+
+    Examples:
+        >>> compiler = get_filter_compiler(UserModel)
+        >>> query = compiler.apply(select(UserModel), {"name__ilike": "иван%", "age__range": (18, 30)})
+    """
+
+    def __init__(self, model: Type) -> None:
+        self._model: Type = model
+        self._columns: Mapping[str, Column] = inspect(model).columns
+        self._shapes: dict[frozenset, tuple[CompiledFilter, ...]] = {}
+
+    def compile(self, filters: Mapping[str, Any]) -> tuple[CompiledFilter, ...]:
+        """
+        Компиляция формы фильтра
+
+        Args:
+            filters (Mapping[str, Any]): Фильтр
+
+        Returns:
+            (tuple[CompiledFilter, ...]): Скомпилированные условия
+
+        Raises:
+            InvalidFilter: Поле отсутствует в модели или оператор не поддерживается
+        """
+        shape: frozenset = frozenset(filters)
+        compiled: tuple[CompiledFilter, ...] | None = self._shapes.get(shape)
+
+        if compiled is None:
+            compiled = self._shapes[shape] = tuple(self._compile_key(key) for key in filters)
+
+        return compiled
+
+    def get_clauses(self, filters: Mapping[str, Any]) -> list[ColumnElement]:
+        """
+        Получение условий WHERE по фильтру
+
+        Args:
+            filters (Mapping[str, Any]): Фильтр
+
+        Returns:
+            (list[ColumnElement]): Условия
+        """
+        return [item.to_clause(filters[item.key]) for item in self.compile(filters)]
+
+    def apply(self, query: Select, filters: Mapping[str, Any] | None) -> Select:
+        """
+        Применение фильтра к запросу
+
+        Args:
+            query (Select): Запрос
+            filters (Mapping[str, Any] | None): Фильтр
+
+        Returns:
+            (Select): Запрос с условиями фильтра
+        """
+        if not filters:
+            return query
+
+        return query.where(*self.get_clauses(filters))
+
+    def _compile_key(self, key: str) -> CompiledFilter:
+        field, _, operator = key.rpartition(SEPARATOR)
+
+        if not field or operator not in OPERATORS:
+            field, operator = key, "eq"
+
+        if field not in self._columns:
+            raise InvalidFilter(detail=f"Фильтрация по полю {field} невозможна")
+
+        return CompiledFilter(key, self._columns[field], OPERATORS[operator])
+
+
+@lru_cache
+def get_filter_compiler(model: Type) -> FilterCompiler:
+    """
+    Получение компилятора фильтров модели. Компилятор создается один раз на модель
+
+    Args:
+        model (Type): Модель сущности
+
+    Returns:
+        (FilterCompiler): Компилятор фильтров
+    """
+    return FilterCompiler(model)
@@ -2,6 +2,8 @@
 
 __author__: str = "Старков Е.П."
 
+from .context import get_request_id, request_id_var
 from .formatter import CustomJsonFormatter
-from .middleware import log_requests
-from .setup import setup_logging
+from .handlers import BatchingQueueListener, BoundedQueueHandler, DropPolicy
+from .middleware import RequestLoggingMiddleware, log_requests
+from .setup import get_logging_stats, setup_logging, shutdown_logging
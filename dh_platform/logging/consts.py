@@ -35,3 +35,8 @@ LOG_CONFIG: dict = {
         "uvicorn": {"handlers": ["console"], "level": "INFO", "propagate": False},
     },
 }
+
+# Размер очереди записей лога
+LOG_QUEUE_SIZE: int = 10000
+# Максимум записей, передаваемых обработчику за один сброс буфера
+LOG_BATCH_SIZE: int = 100
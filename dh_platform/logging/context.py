@@ -0,0 +1,39 @@
+"""Модуль контекста записей лога"""
+
+__author__: str = "Старков Е.П."
+
+import logging
+from contextvars import ContextVar
+from typing import Any, Callable
+
+# Идентификатор текущего запроса
+request_id_var: ContextVar[str | None] = ContextVar("dh_request_id", default=None)
+
+
+def get_request_id() -> str | None:
+    """
+    Получение идентификатора текущего запроса
+
+    Returns:
+        (str | None): Идентификатор запроса или None вне запроса
+    """
+    return request_id_var.get()
+
+
+def install_record_factory() -> None:
+    """
+    Добавление идентификатора запроса во все записи лога (атрибут request_id).
+    Значение берется в потоке, создающем запись, поэтому доступно и при логировании через очередь
+    """
+    factory: Callable[..., logging.LogRecord] = logging.getLogRecordFactory()
+
+    if getattr(factory, "_dh_request_id", False):
+        return
+
+    def record_factory(*args: Any, **kwargs: Any) -> logging.LogRecord:
+        record: logging.LogRecord = factory(*args, **kwargs)
+        record.request_id = request_id_var.get()
+        return record
+
+    record_factory._dh_request_id = True  # type: ignore[attr-defined]
+    logging.setLogRecordFactory(record_factory)
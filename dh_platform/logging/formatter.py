@@ -2,15 +2,143 @@
 
 __author__: str = "Старков Е.П."
 
+import json
+import logging
+import time
+from datetime import datetime, timezone
+from typing import Any, Callable
+
 from pythonjsonlogger.json import JsonFormatter
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
+
+# Ключи словаря не только строками, как у стандартного json
+_ORJSON_OPTIONS: int = orjson.OPT_NON_STR_KEYS if orjson is not None else 0
+
 
 class CustomJsonFormatter(JsonFormatter):
-    """Кастомный форматтер. Предназначен для правильной интерпретации русского языка"""
-
-    def process_log_record(self, log_record):
-        # Преобразуем все строки в UTF-8
-        for key, value in log_record.items():
-            if isinstance(value, str):
-                log_record[key] = value.encode("utf-8").decode("utf-8")
-        return super().process_log_record(log_record)
+    """
+    Форматтер записей лога в JSON.
+    Список полей и их переименования вычисляются один раз при создании форматтера, время форматируется
+    один раз в секунду. При json_ensure_ascii=False русский текст выводится без экранирования.
+    Если установлен orjson, он используется для сериализации, иначе - заранее созданный JSONEncoder
+
+    Args:
+        fast_json (bool): Использовать orjson, если он установлен. Вывод orjson не содержит пробелов
+            между элементами
+        args: аргументы JsonFormatter
+        kwargs: аргументы JsonFormatter
+
+    Examples:
+        >>> formatter = CustomJsonFormatter(
+        ...     "%(asctime)s %(levelname)s %(name)s %(message)s",
+        ...     rename_fields={"levelname": "level", "asctime": "timestamp"},
+        ...     datefmt="%Y-%m-%dT%H:%M:%SZ",
+        ...     json_ensure_ascii=False,
+        ... )
+    """
+
+    def __init__(self, *args: Any, fast_json: bool = True, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        # Пары (атрибут записи, ключ в JSON) полей из format
+        self._fields: tuple[tuple[str, str], ...] = tuple(
+            (field, self.rename_fields.get(field, field)) for field in self._required_fields
+        )
+        self._defaults: dict[str, Any] = {
+            self.rename_fields.get(key, key): value for key, value in getattr(self, "defaults", {}).items()
+        }
+        self._static_fields: dict[str, Any] = {
+            self.rename_fields.get(key, key): value for key, value in self.static_fields.items()
+        }
+        self._has_asctime: bool = "asctime" in self._required_fields
+        self._time_cache: tuple[int, str] = (-1, "")
+        self._encoder: json.JSONEncoder = (self.json_encoder or json.JSONEncoder)(
+            default=self.json_default, ensure_ascii=self.json_ensure_ascii, indent=self.json_indent
+        )
+        self._fast_dumps: Callable[[Any], bytes] | None = None
+
+        if fast_json and orjson is not None and not self.json_ensure_ascii and self.json_indent is None:
+            self._fast_dumps = lambda data: orjson.dumps(data, default=self._encoder.default, option=_ORJSON_OPTIONS)
+
+    def format(self, record: logging.LogRecord) -> str:
+        message_dict: dict[str, Any] | None = None
+
+        if isinstance(record.msg, dict):
+            message_dict = record.msg.copy()
+            record.message = ""
+        else:
+            record.message = record.getMessage()
+
+        if self._has_asctime:
+            record.asctime = self.formatTime(record, self.datefmt)
+
+        if record.exc_info or record.exc_text or record.stack_info:
+            message_dict = message_dict or {}
+            self._add_traceback(record, message_dict)
+
+        record_dict: dict[str, Any] = record.__dict__
+        rename: dict[str, str] = self.rename_fields
+        log_data: dict[str, Any] = dict(self._defaults) if self._defaults else {}
+
+        for field, key in self._fields:
+            log_data[key] = record_dict.get(field)
+
+        if self._static_fields:
+            log_data.update(self._static_fields)
+
+        if message_dict:
+            for key, value in message_dict.items():
+                log_data[rename.get(key, key)] = value
+
+        skip: set[str] = self._skip_fields
+
+        for key, value in record_dict.items():
+            if key not in skip and not (isinstance(key, str) and key.startswith("_")):
+                log_data[rename.get(key, key)] = value
+
+        if self.timestamp:
+            timestamp_key: str = self.timestamp if isinstance(self.timestamp, str) else "timestamp"
+            log_data[rename.get(timestamp_key, timestamp_key)] = datetime.fromtimestamp(record.created, tz=timezone.utc)
+
+        return self.serialize_log_record(self.process_log_record(log_data))
+
+    def formatTime(self, record: logging.LogRecord, datefmt: str | None = None) -> str:
+        """Форматирование времени записи. Результат переиспользуется для записей той же секунды"""
+        if datefmt is None or "%f" in datefmt:
+            return super().formatTime(record, datefmt)
+
+        second: int = int(record.created)
+        cached_second, cached_value = self._time_cache
+
+        if cached_second != second:
+            cached_value = time.strftime(datefmt, self.converter(record.created))
+            self._time_cache = (second, cached_value)
+
+        return cached_value
+
+    def jsonify_log_record(self, log_data: dict[str, Any]) -> str:
+        if self._fast_dumps is not None:
+            try:
+                return self._fast_dumps(log_data).decode()
+            except TypeError:
+                # Значения, которые orjson не сериализует (например, целые больше 64 бит)
+                pass
+
+        if self.json_serializer is not json.dumps:
+            return super().jsonify_log_record(log_data)
+
+        return self._encoder.encode(log_data)
+
+    def _add_traceback(self, record: logging.LogRecord, message_dict: dict[str, Any]) -> None:
+        """Добавление исключения и стека вызовов в данные записи"""
+        if record.exc_info and not message_dict.get("exc_info"):
+            message_dict["exc_info"] = self.formatException(record.exc_info)
+
+        if not message_dict.get("exc_info") and record.exc_text:
+            message_dict["exc_info"] = record.exc_text
+
+        if record.stack_info and not message_dict.get("stack_info"):
+            message_dict["stack_info"] = self.formatStack(record.stack_info)
@@ -0,0 +1,206 @@
+"""Модуль обработчиков логирования через очередь"""
+
+__author__: str = "Старков Е.П."
+
+import copy
+import logging
+import queue
+import threading
+from enum import Enum
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+
+# Форматирование исключений при подготовке записи в вызывающем потоке
+_EXCEPTION_FORMATTER: logging.Formatter = logging.Formatter()
+
+
+class DropPolicy(str, Enum):
+    """
+    Поведение при заполненной очереди записей лога
+
+    Attributes:
+        DROP_NEW: Новая запись отбрасывается
+        DROP_OLDEST: Самая старая запись очереди отбрасывается
+    """
+
+    DROP_NEW = "drop_new"
+    DROP_OLDEST = "drop_oldest"
+
+
+class BoundedQueueHandler(QueueHandler):
+    """
+    Обработчик, передающий записи лога в ограниченную очередь без блокировки вызывающего потока.
+    При заполненной очереди запись отбрасывается согласно политике
+
+    Args:
+        log_queue (queue.Queue): Очередь записей
+        drop_policy (DropPolicy): Поведение при заполненной очереди
+
+    Attributes:
+        enqueued (int): Количество принятых записей
+        dropped (int): Количество отброшенных записей
+    """
+
+    def __init__(self, log_queue: queue.Queue, drop_policy: DropPolicy = DropPolicy.DROP_NEW) -> None:
+        super().__init__(log_queue)
+        self.drop_policy: DropPolicy = drop_policy
+        self.enqueued: int = 0
+        self.dropped: int = 0
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """Счетчики очереди"""
+        return {"enqueued": self.enqueued, "dropped": self.dropped, "size": self.queue.qsize()}
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """
+        Подготовка записи к передаче в другой поток: подстановка аргументов сообщения
+        и форматирование исключения. В отличие от QueueHandler исключение не добавляется в текст сообщения,
+        форматтеры обработчиков получают его отдельно
+        """
+        record = copy.copy(record)
+        record.message = record.msg = record.getMessage()
+        record.args = None
+
+        if record.exc_info:
+            record.exc_text = record.exc_text or _EXCEPTION_FORMATTER.formatException(record.exc_info)
+            record.exc_info = None
+
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+            if self.drop_policy == DropPolicy.DROP_NEW:
+                return
+
+            try:
+                self.queue.get_nowait()
+                self.queue.put_nowait(record)
+            except (queue.Empty, queue.Full):
+                return
+
+        self.enqueued += 1
+
+
+class BatchingQueueListener(QueueListener):
+    """
+    Поток, забирающий записи из очереди пачками и передающий их обработчикам.
+    Обработчики потоков и файлов получают пачку одной записью с одним сбросом буфера,
+    остальные обработчики - по одной записи
+
+    Args:
+        log_queue (queue.Queue): Очередь записей
+        handlers (logging.Handler): Обработчики
+        batch_size (int): Максимум записей в пачке
+
+    Attributes:
+        processed (int): Количество обработанных записей
+        batches (int): Количество пачек
+    """
+
+    def __init__(self, log_queue: queue.Queue, *handlers: logging.Handler, batch_size: int = 100) -> None:
+        super().__init__(log_queue, *handlers, respect_handler_level=True)
+        self.batch_size: int = batch_size
+        self.processed: int = 0
+        self.batches: int = 0
+
+    def start(self) -> None:
+        self._thread = threading.Thread(target=self._monitor, name="dh-log-listener", daemon=True)
+        self._thread.start()
+
+    def enqueue_sentinel(self) -> None:
+        # Очередь ограничена, поэтому сигнал остановки ожидает освобождения места
+        self.queue.put(self._sentinel)
+
+    def _monitor(self) -> None:
+        stopping: bool = False
+
+        while True:
+            records, sentinels = self._get_batch(block=not stopping)
+
+            if records:
+                self.handle_batch(records)
+
+            for _ in range(len(records) + sentinels):
+                self.queue.task_done()
+
+            if stopping and not records and not sentinels:
+                return
+
+            # Записи, поступившие после сигнала остановки, обрабатываются до завершения потока
+            stopping = stopping or bool(sentinels)
+
+    def _get_batch(self, block: bool) -> tuple[list[logging.LogRecord], int]:
+        """
+        Получение пачки записей из очереди. Пачка заканчивается на сигнале остановки
+
+        Args:
+            block (bool): Ожидать первую запись
+
+        Returns:
+            (tuple[list[logging.LogRecord], int]): Записи и количество полученных сигналов остановки
+        """
+        records: list[logging.LogRecord] = []
+
+        while len(records) < self.batch_size:
+            try:
+                record: logging.LogRecord = self.dequeue(block and not records)
+            except queue.Empty:
+                break
+
+            if record is self._sentinel:
+                return records, 1
+
+            records.append(record)
+
+        return records, 0
+
+    def handle_batch(self, records: list[logging.LogRecord]) -> None:
+        """
+        Передача пачки записей обработчикам
+
+        Args:
+            records (list[logging.LogRecord]): Записи
+        """
+        records = [self.prepare(record) for record in records]
+
+        for handler in self.handlers:
+            accepted: list[logging.LogRecord] = [
+                record for record in records if record.levelno >= handler.level and handler.filter(record)
+            ]
+
+            if not accepted:
+                continue
+
+            if isinstance(handler, logging.StreamHandler):
+                _emit_batch(handler, accepted)
+            else:
+                for record in accepted:
+                    handler.handle(record)
+
+        self.processed += len(records)
+        self.batches += 1
+
+
+def _emit_batch(handler: logging.StreamHandler, records: list[logging.LogRecord]) -> None:
+    """Запись пачки в поток обработчика с одним сбросом буфера. Ротация файла проверяется для каждой записи"""
+    with handler.lock:  # type: ignore[union-attr]
+        for record in records:
+            try:
+                if isinstance(handler, RotatingFileHandler) and handler.shouldRollover(record):
+                    handler.doRollover()
+
+                if handler.stream is None:
+                    handler.stream = handler._open()  # type: ignore[attr-defined]
+
+                handler.stream.write(handler.format(record) + handler.terminator)
+            except Exception:
+                handler.handleError(record)
+
+        try:
+            handler.flush()
+        except Exception:
+            handler.handleError(records[-1])
@@ -3,16 +3,32 @@
 __author__: str = "Старков Е.П."
 
 import logging
-from typing import Callable
+import random
+import time
+from typing import Any, Awaitable, Callable, Iterable, MutableMapping
+from uuid import uuid4
 
 from fastapi import Request
+from starlette.routing import Match
+
+from dh_platform.logging.context import request_id_var
 
 logger = logging.getLogger("dh_logger")
 
+Scope = MutableMapping[str, Any]
+Message = MutableMapping[str, Any]
+Receive = Callable[[], Awaitable[Message]]
+Send = Callable[[Message], Awaitable[None]]
+ASGIApp = Callable[[Scope, Receive, Send], Awaitable[None]]
+
+# Максимальная длина идентификатора запроса из заголовка
+_MAX_REQUEST_ID_LENGTH: int = 128
+
 
 async def log_requests(request: Request, call_next: Callable) -> None:
     """
-    Middleware для логирования запросов в FastAPI
+    Middleware для логирования запросов в FastAPI.
+    Оставлено для совместимости, используйте RequestLoggingMiddleware
 
     Args:
         request: запрос
@@ -31,3 +47,111 @@ async def log_requests(request: Request, call_next: Callable) -> None:
     except Exception as ex:
         logger.exception("Исключение: %s", ex)
         raise
+
+
+class RequestLoggingMiddleware:
+    """
+    ASGI middleware логирования запросов.
+    На каждый запрос пишется одна запись с методом, шаблоном маршрута, статусом и временем обработки.
+    Идентификатор запроса берется из заголовка или генерируется, возвращается в заголовке ответа
+    и добавляется во все записи лога, созданные при обработке запроса (атрибут request_id).
+    Потоковые ответы не буферизуются
+
+    Args:
+        app: ASGI-приложение
+        sample_rate: доля логируемых успешных запросов (статус меньше 400), от 0 до 1.
+            Ошибочные запросы логируются всегда
+        exclude_paths: пути, запросы к которым не логируются (например, проверки доступности)
+        request_id_header: заголовок идентификатора запроса
+
+    Examples:
+        >>> from dh_platform.logging import RequestLoggingMiddleware
+        >>>
+        >>> app.add_middleware(RequestLoggingMiddleware, sample_rate=0.1, exclude_paths=["/health"])
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        sample_rate: float = 1.0,
+        exclude_paths: Iterable[str] = (),
+        request_id_header: str = "x-request-id",
+    ) -> None:
+        self.app: ASGIApp = app
+        self.sample_rate: float = sample_rate
+        self.exclude_paths: frozenset[str] = frozenset(exclude_paths)
+        self._header: bytes = request_id_header.lower().encode("latin-1")
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["path"] in self.exclude_paths:
+            await self.app(scope, receive, send)
+            return
+
+        request_id: str = self._get_request_id(scope)
+        token = request_id_var.set(request_id)
+        status_code: int = 500
+        started: float = time.perf_counter()
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                message["headers"] = [*message.get("headers", ()), (self._header, request_id.encode("latin-1"))]
+
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        except Exception:
+            status_code = 500
+            self._log(scope, status_code, time.perf_counter() - started, exc_info=True)
+            raise
+        else:
+            if status_code >= 400 or self.sample_rate >= 1 or random.random() < self.sample_rate:
+                self._log(scope, status_code, time.perf_counter() - started)
+        finally:
+            request_id_var.reset(token)
+
+    def _get_request_id(self, scope: Scope) -> str:
+        for name, value in scope.get("headers", ()):
+            if name == self._header and value:
+                return value.decode("latin-1")[:_MAX_REQUEST_ID_LENGTH]
+
+        return uuid4().hex
+
+    @staticmethod
+    def _log(scope: Scope, status_code: int, duration: float, exc_info: bool = False) -> None:
+        route: str = _get_route_template(scope)
+        duration_ms: float = round(duration * 1000, 3)
+        level: int = logging.ERROR if status_code >= 500 else logging.INFO
+        logger.log(
+            level,
+            "%s %s %d %.1f мс",
+            scope["method"],
+            route,
+            status_code,
+            duration_ms,
+            exc_info=exc_info,
+            extra={
+                "http_method": scope["method"],
+                "http_route": route,
+                "http_path": scope["path"],
+                "http_status": status_code,
+                "duration_ms": duration_ms,
+            },
+        )
+
+
+def _get_route_template(scope: Scope) -> str:
+    """Шаблон маршрута запроса (/users/{user_id}) или путь, если маршрут не найден"""
+    route: Any = scope.get("route")
+
+    if route is None:
+        # Старые версии Starlette не сохраняют маршрут в scope
+        for candidate in getattr(scope.get("router"), "routes", ()):
+            if candidate.matches(scope)[0] == Match.FULL:
+                route = candidate
+                break
+
+    return getattr(route, "path", None) or scope["path"]
@@ -2,21 +2,50 @@
 
 __author__: str = "Старков Е.П."
 
+import atexit
+import logging
+import queue
 from logging.config import dictConfig
 from pathlib import Path
 
-from dh_platform.logging.consts import LOG_CONFIG
+from dh_platform.logging.consts import (
+    LOG_BATCH_SIZE,
+    LOG_CONFIG,
+    LOG_QUEUE_SIZE,
+)
+from dh_platform.logging.context import install_record_factory
+from dh_platform.logging.handlers import (
+    BatchingQueueListener,
+    BoundedQueueHandler,
+    DropPolicy,
+)
 
+# Запущенные потоки обработки очередей логов
+_listeners: list[BatchingQueueListener] = []
 
-def setup_logging() -> None:
+
+def setup_logging(
+    use_queue: bool = False,
+    queue_size: int = LOG_QUEUE_SIZE,
+    drop_policy: DropPolicy = DropPolicy.DROP_NEW,
+    batch_size: int = LOG_BATCH_SIZE,
+) -> None:
     """
     Настройка логирования
 
+    Args:
+        use_queue (bool): Передавать записи обработчикам через очередь. Вывод в консоль и файл
+            выполняется в отдельном потоке и не блокирует цикл событий
+        queue_size (int): Размер очереди записей
+        drop_policy (DropPolicy): Поведение при заполненной очереди
+        batch_size (int): Максимум записей, записываемых обработчиком за один сброс буфера
+
     Examples:
         >>> @asynccontextmanager
         >>> async def lifespan(_: FastAPI):
-        ...     setup_logging()
+        ...     setup_logging(use_queue=True)
         ...     yield
+        ...     shutdown_logging()
         >>>
         >>> app: FastAPI = FastAPI(
         ...     title=settings.core.PROJECT_NAME,
@@ -28,4 +57,64 @@ def setup_logging() -> None:
     # Создаем директорию для логов если ее нет
     Path("logs").mkdir(exist_ok=True)
 
+    shutdown_logging()
     dictConfig(LOG_CONFIG)
+    install_record_factory()
+
+    if use_queue:
+        _attach_queues(queue_size, drop_policy, batch_size)
+
+
+def shutdown_logging() -> None:
+    """Обработка оставшихся в очередях записей и остановка потоков логирования"""
+    while _listeners:
+        _listeners.pop().stop()
+
+
+def get_logging_stats() -> dict[str, dict[str, int]]:
+    """
+    Счетчики очередей логирования
+
+    Returns:
+        (dict[str, dict[str, int]]): Счетчики по именам логгеров, использующих очередь
+    """
+    stats: dict[str, dict[str, int]] = {}
+
+    for name in LOG_CONFIG["loggers"]:
+        for handler in logging.getLogger(name or None).handlers:
+            if isinstance(handler, BoundedQueueHandler):
+                stats[name or "root"] = handler.stats
+
+    return stats
+
+
+def _attach_queues(queue_size: int, drop_policy: DropPolicy, batch_size: int) -> None:
+    """
+    Замена обработчиков логгеров из LOG_CONFIG на обработчики очереди.
+    Логгеры с одинаковым набором обработчиков используют общую очередь и поток
+    """
+    queue_handlers: dict[tuple[logging.Handler, ...], BoundedQueueHandler] = {}
+
+    for name in LOG_CONFIG["loggers"]:
+        logger: logging.Logger = logging.getLogger(name or None)
+        handlers: tuple[logging.Handler, ...] = tuple(logger.handlers)
+
+        if not handlers:
+            continue
+
+        queue_handler: BoundedQueueHandler | None = queue_handlers.get(handlers)
+
+        if queue_handler is None:
+            log_queue: queue.Queue = queue.Queue(queue_size)
+            queue_handler = queue_handlers[handlers] = BoundedQueueHandler(log_queue, drop_policy)
+            listener: BatchingQueueListener = BatchingQueueListener(log_queue, *handlers, batch_size=batch_size)
+            listener.start()
+            _listeners.append(listener)
+
+        for handler in handlers:
+            logger.removeHandler(handler)
+
+        logger.addHandler(queue_handler)
+
+
+atexit.register(shutdown_logging)
@@ -0,0 +1,422 @@
+"""Модуль метрик в формате Prometheus"""
+
+__author__: str = "Старков Е.П."
+
+import time
+from bisect import bisect_left
+from typing import Any, Callable, Iterable, Sequence
+
+from fastapi import APIRouter, Response
+from sqlalchemy import Row, event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+# Границы интервалов гистограмм по-умолчанию, секунды
+DEFAULT_BUCKETS: tuple[float, ...] = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+# Тип содержимого текстового формата Prometheus
+CONTENT_TYPE: str = "text/plain; version=0.0.4; charset=utf-8"
+
+
+class _Child:
+    """Значение метрики для одного набора меток"""
+
+    __slots__ = ("value",)
+
+    def __init__(self) -> None:
+        self.value: float = 0
+
+    def inc(self, amount: float = 1) -> None:
+        """Увеличение значения"""
+        self.value += amount
+
+    def set(self, value: float) -> None:
+        """Установка значения"""
+        self.value = value
+
+
+class _HistogramChild:
+    """Гистограмма для одного набора меток"""
+
+    __slots__ = ("buckets", "counts", "sum", "count")
+
+    def __init__(self, buckets: tuple[float, ...]) -> None:
+        self.buckets: tuple[float, ...] = buckets
+        self.counts: list[int] = [0] * (len(buckets) + 1)
+        self.sum: float = 0
+        self.count: int = 0
+
+    def observe(self, value: float) -> None:
+        """Учет значения"""
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+
+class Metric:
+    """
+    Метрика с метками.
+    Значение для набора меток создается при первом обращении и кэшируется. Метрики рассчитаны на работу
+    в одном потоке цикла событий и не используют блокировки
+
+    Args:
+        name (str): Название
+        documentation (str): Описание
+        labelnames (Sequence[str]): Названия меток
+    """
+
+    type_name: str = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> None:
+        self.name: str = name
+        self.documentation: str = documentation
+        self.labelnames: tuple[str, ...] = tuple(labelnames)
+        self._children: dict[tuple[str, ...], Any] = {}
+
+    def labels(self, *values: str) -> Any:
+        """
+        Получение значения метрики для набора меток
+
+        Args:
+            values (str): Значения меток в порядке labelnames
+
+        Returns:
+            Значение метрики
+        """
+        child: Any = self._children.get(values)
+
+        if child is None:
+            if len(values) != len(self.labelnames):
+                raise ValueError(f"Метрика {self.name} ожидает метки {self.labelnames}")
+
+            child = self._children[values] = self._new_child()
+
+        return child
+
+    def clear(self) -> None:
+        """Удаление всех значений"""
+        self._children.clear()
+
+    def render(self) -> Iterable[str]:
+        """Строки метрики в текстовом формате Prometheus"""
+        yield f"# HELP {self.name} {self.documentation}"
+        yield f"# TYPE {self.name} {self.type_name}"
+
+        for values, child in self._children.items():
+            yield from self._render_child(values, child)
+
+    def _new_child(self) -> Any:
+        return _Child()
+
+    def _render_child(self, values: tuple[str, ...], child: Any) -> Iterable[str]:
+        yield f"{self.name}{self._format_labels(values)} {_format_value(child.value)}"
+
+    def _format_labels(self, values: tuple[str, ...], extra: str = "") -> str:
+        pairs: list[str] = [f'{name}="{_escape(value)}"' for name, value in zip(self.labelnames, values)]
+
+        if extra:
+            pairs.append(extra)
+
+        return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+class Counter(Metric):
+    """Счетчик. Значение только увеличивается"""
+
+    type_name: str = "counter"
+
+
+class Gauge(Metric):
+    """Показатель. Значение устанавливается произвольно"""
+
+    type_name: str = "gauge"
+
+
+class Histogram(Metric):
+    """
+    Гистограмма распределения значений
+
+    Args:
+        name (str): Название
+        documentation (str): Описание
+        labelnames (Sequence[str]): Названия меток
+        buckets (Sequence[float]): Верхние границы интервалов
+    """
+
+    type_name: str = "histogram"
+
+    def __init__(
+        self, name: str, documentation: str, labelnames: Sequence[str] = (), buckets: Sequence[float] = DEFAULT_BUCKETS
+    ) -> None:
+        super().__init__(name, documentation, labelnames)
+        self.buckets: tuple[float, ...] = tuple(sorted(buckets))
+
+    def _new_child(self) -> _HistogramChild:
+        return _HistogramChild(self.buckets)
+
+    def _render_child(self, values: tuple[str, ...], child: _HistogramChild) -> Iterable[str]:
+        labels: str = self._format_labels(values)
+        cumulative: int = 0
+
+        for bound, count in zip((*self.buckets, float("inf")), child.counts):
+            cumulative += count
+            bucket_labels: str = self._format_labels(values, 'le="' + _format_value(bound) + '"')
+            yield f"{self.name}_bucket{bucket_labels} {cumulative}"
+
+        yield f"{self.name}_sum{labels} {_format_value(child.sum)}"
+        yield f"{self.name}_count{labels} {child.count}"
+
+
+class MetricsRegistry:
+    """
+    Реестр метрик процесса
+
+    Attributes:
+        enabled (bool): Сбор метрик включен. При выключенном сборе инструментирование не выполняет учет
+
+    Examples:
+        >>> from dh_platform.metrics import metrics
+        >>>
+        >>> orders = metrics.counter("orders_created_total", "Созданные заказы", ["channel"])
+        >>> orders.labels("web").inc()
+    """
+
+    def __init__(self) -> None:
+        self.enabled: bool = True
+        self._metrics: dict[str, Metric] = {}
+        self._collectors: list[Callable[[], None]] = []
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        """Получение или создание счетчика"""
+        return self._get_or_create(Counter, name, documentation, labelnames)
+
+    def gauge(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Gauge:
+        """Получение или создание показателя"""
+        return self._get_or_create(Gauge, name, documentation, labelnames)
+
+    def histogram(
+        self, name: str, documentation: str, labelnames: Sequence[str] = (), buckets: Sequence[float] = DEFAULT_BUCKETS
+    ) -> Histogram:
+        """Получение или создание гистограммы"""
+        return self._get_or_create(Histogram, name, documentation, labelnames, buckets=buckets)
+
+    def add_collector(self, collector: Callable[[], None]) -> None:
+        """
+        Добавление функции, обновляющей показатели перед выводом метрик
+
+        Args:
+            collector (Callable[[], None]): Функция обновления
+        """
+        self._collectors.append(collector)
+
+    def render(self) -> str:
+        """
+        Вывод всех метрик в текстовом формате Prometheus
+
+        Returns:
+            (str): Метрики
+        """
+        for collector in self._collectors:
+            collector()
+
+        lines: list[str] = [line for metric in self._metrics.values() for line in metric.render()]
+
+        return "\n".join(lines) + "\n"
+
+    def clear(self) -> None:
+        """Сброс значений всех метрик"""
+        for metric in self._metrics.values():
+            metric.clear()
+
+    def _get_or_create(self, metric_class: type, name: str, documentation: str, labelnames: Sequence[str], **kwargs):
+        metric: Metric | None = self._metrics.get(name)
+
+        if metric is None:
+            metric = self._metrics[name] = metric_class(name, documentation, labelnames, **kwargs)
+        elif not isinstance(metric, metric_class) or metric.labelnames != tuple(labelnames):
+            raise ValueError(f"Метрика {name} уже зарегистрирована с другим типом или метками")
+
+        return metric
+
+
+metrics: MetricsRegistry = MetricsRegistry()
+
+db_pool_checkouts = metrics.counter("dh_db_pool_checkouts_total", "Выдачи соединений из пула", ["engine"])
+db_pool_connects = metrics.counter("dh_db_pool_connects_total", "Новые соединения с БД", ["engine"])
+db_pool_wait = metrics.histogram("dh_db_pool_wait_seconds", "Ожидание соединения из пула", ["engine"])
+db_pool_size = metrics.gauge("dh_db_pool_size", "Размер пула", ["engine"])
+db_pool_checked_out = metrics.gauge("dh_db_pool_checked_out", "Выданные соединения пула", ["engine"])
+db_pool_overflow = metrics.gauge("dh_db_pool_overflow", "Соединения сверх размера пула", ["engine"])
+service_duration = metrics.histogram(
+    "dh_service_method_seconds", "Время выполнения методов сервисов", ["service", "method"]
+)
+service_rows = metrics.counter(
+    "dh_service_method_rows_total", "Записи, возвращенные методами сервисов", ["service", "method"]
+)
+service_errors = metrics.counter("dh_service_method_errors_total", "Ошибки методов сервисов", ["service", "method"])
+bus_published = metrics.counter("dh_bus_events_published_total", "Опубликованные события", ["event_type"])
+bus_dispatch_duration = metrics.histogram(
+    "dh_bus_dispatch_seconds", "Время обработки события всеми обработчиками", ["event_type"]
+)
+bus_handler_duration = metrics.histogram(
+    "dh_bus_handler_seconds", "Время выполнения обработчиков событий", ["event_type", "handler"]
+)
+bus_handler_errors = metrics.counter(
+    "dh_bus_handler_errors_total", "Ошибки обработчиков событий", ["event_type", "handler"]
+)
+
+# Инструментированные движки по названиям
+_engines: dict[str, AsyncEngine] = {}
+
+
+def instrument_engine(target: AsyncEngine, name: str) -> None:
+    """
+    Сбор метрик пула соединений движка: выдачи, новые соединения, ожидание соединения и размер пула
+
+    Args:
+        target (AsyncEngine): Движок SQLAlchemy
+        name (str): Название движка в метках
+    """
+    sync_engine = target.sync_engine
+    _engines[name] = target
+    _time_pool_connect(sync_engine.pool, name)
+
+    @event.listens_for(sync_engine, "checkout")
+    def _on_checkout(dbapi_connection, connection_record, connection_proxy) -> None:
+        if metrics.enabled:
+            db_pool_checkouts.labels(name).inc()
+
+    @event.listens_for(sync_engine, "connect")
+    def _on_connect(dbapi_connection, connection_record) -> None:
+        if metrics.enabled:
+            db_pool_connects.labels(name).inc()
+
+    @event.listens_for(sync_engine, "engine_disposed")
+    def _on_disposed(connection) -> None:
+        # dispose() заменяет пул новым
+        _time_pool_connect(sync_engine.pool, name)
+
+
+def _time_pool_connect(pool: Any, name: str) -> None:
+    """Учет времени получения соединения из пула, включая ожидание свободного соединения"""
+    connect: Callable[[], Any] = pool.connect
+
+    def timed_connect() -> Any:
+        if not metrics.enabled:
+            return connect()
+
+        started: float = time.perf_counter()
+
+        try:
+            return connect()
+        finally:
+            db_pool_wait.labels(name).observe(time.perf_counter() - started)
+
+    pool.connect = timed_connect
+
+
+def _collect_pools() -> None:
+    for name, target in _engines.items():
+        pool: Any = target.pool
+
+        for gauge, method in (
+            (db_pool_size, "size"),
+            (db_pool_checked_out, "checkedout"),
+            (db_pool_overflow, "overflow"),
+        ):
+            value: Callable[[], int] | None = getattr(pool, method, None)
+
+            if value is not None:
+                gauge.labels(name).set(value())
+
+
+metrics.add_collector(_collect_pools)
+
+
+def count_rows(result: Any) -> int:
+    """
+    Количество записей в результате метода сервиса.
+    Числа (count, количество удаленных записей) и другие скалярные значения записями не считаются
+
+    Args:
+        result (Any): Результат метода
+
+    Returns:
+        (int): Количество записей
+    """
+    if result is None or isinstance(result, (int, float, str, bytes)):
+        return 0
+
+    if isinstance(result, Row):
+        return 1
+
+    if isinstance(result, (list, tuple)):
+        return len(result)
+
+    items: Any = getattr(result, "items", None)
+
+    if isinstance(items, list):
+        return len(items)
+
+    return 1
+
+
+def observe_service_call(service: str, method: str, duration: float, result: Any = None, failed: bool = False) -> None:
+    """
+    Учет вызова метода сервиса
+
+    Args:
+        service (str): Название сервиса
+        method (str): Название метода
+        duration (float): Время выполнения, секунды
+        result (Any): Результат метода
+        failed (bool): Метод завершился исключением
+    """
+    service_duration.labels(service, method).observe(duration)
+
+    if failed:
+        service_errors.labels(service, method).inc()
+    else:
+        service_rows.labels(service, method).inc(count_rows(result))
+
+
+def metrics_endpoint() -> Response:
+    """
+    Эндпоинт вывода метрик
+
+    Examples:
+        >>> from dh_platform.metrics import metrics_endpoint
+        >>>
+        >>> app.add_api_route("/metrics", metrics_endpoint, include_in_schema=False)
+    """
+    return Response(metrics.render(), media_type=CONTENT_TYPE)
+
+
+def get_metrics_router(path: str = "/metrics") -> APIRouter:
+    """
+    Роутер с эндпоинтом вывода метрик
+
+    Args:
+        path (str): Путь эндпоинта
+
+    Returns:
+        (APIRouter): Роутер
+
+    Examples:
+        >>> from dh_platform.metrics import get_metrics_router
+        >>>
+        >>> app.include_router(get_metrics_router())
+    """
+    router: APIRouter = APIRouter()
+    router.add_api_route(path, metrics_endpoint, methods=["GET"], include_in_schema=False)
+
+    return router
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+
+    return repr(float(value)) if isinstance(value, float) else str(value)
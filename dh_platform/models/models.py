@@ -2,12 +2,24 @@
 
 __author__: str = "Старков Е.П."
 
+from functools import lru_cache
+from operator import attrgetter, itemgetter
+from typing import Any, Callable, ClassVar, Iterable, Type, TypeVar
+
+from pydantic import BaseModel as Schema
+from pydantic import TypeAdapter
+from sqlalchemy import Row
 from sqlalchemy.orm import DeclarativeBase, declared_attr
+from sqlalchemy.orm.exc import UnmappedColumnError
+
+S = TypeVar("S", bound=Schema)
 
 
 class BaseModel(DeclarativeBase):
     """
-    Абстрактная базовая модель со стандартными полями
+    Абстрактная базовая модель со стандартными полями.
+    При создании класса модели один раз строится сериализатор: кортеж названий колонок и получение
+    значений атрибутов одним вызовом itemgetter из __dict__ экземпляра (attrgetter, если атрибуты не загружены)
 
     Examples:
         >>> from dh_platform.models import BaseModel, IDMixin
@@ -18,11 +30,121 @@ class BaseModel(DeclarativeBase):
 
     __abstract__ = True
 
+    # Названия колонок таблицы модели
+    _COLUMN_KEYS: ClassVar[tuple[str, ...]] = ()
+    # Получение значений колонок экземпляра одним вызовом
+    _VALUES_GETTER: ClassVar[Callable[[Any], tuple]] = staticmethod(lambda _: ())
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+
+        if "__mapper__" in cls.__dict__:
+            cls._build_serializer()
+
     @declared_attr.directive
     def __tablename__(self) -> str:
         """Конвертирует CamelCase в snake_case"""
         name = self.__name__
         return name[0].lower() + "".join([f"_{c.lower()}" if c.isupper() else c for c in name[1:]])
 
-    def to_dict(self):
-        return {column.name: getattr(self, column.name) for column in self.__table__.columns}
+    def to_dict(self) -> dict[str, Any]:
+        """
+        Преобразование экземпляра в словарь с названиями колонок в качестве ключей
+
+        Returns:
+            (dict[str, Any]): Данные экземпляра
+        """
+        return dict(zip(self._COLUMN_KEYS, self._VALUES_GETTER(self)))
+
+    @classmethod
+    def to_dicts(cls, rows: Iterable[Any]) -> list[dict[str, Any]]:
+        """
+        Преобразование набора записей в словари.
+        Принимает экземпляры модели или строки запроса колонок таблицы (select(Model.__table__)),
+        для которых экземпляры модели не создаются. Все записи набора должны быть одного вида
+
+        Args:
+            rows (Iterable[Any]): Экземпляры модели или строки результата запроса
+
+        Returns:
+            (list[dict[str, Any]]): Данные записей
+
+        Examples:
+            >>> rows = (await session.execute(select(User.__table__).where(...))).all()
+            >>> User.to_dicts(rows)
+        """
+        items: list[Any] = rows if isinstance(rows, list) else list(rows)
+
+        if items and isinstance(items[0], Row):
+            fields: tuple[str, ...] = items[0]._fields
+            return [dict(zip(fields, row)) for row in items]
+
+        keys: tuple[str, ...] = cls._COLUMN_KEYS
+        getter: Callable[[Any], tuple] = cls._VALUES_GETTER
+
+        return [dict(zip(keys, getter(row))) for row in items]
+
+    @classmethod
+    def to_schema(cls, rows: Iterable[Any], schema: Type[S]) -> list[S]:
+        """
+        Преобразование набора записей в схемы Pydantic одной проверкой списка.
+        Валидатор списка создается один раз на схему
+
+        Args:
+            rows (Iterable[Any]): Экземпляры модели или строки результата запроса
+            schema (Type[S]): Класс схемы
+
+        Returns:
+            (list[S]): Схемы
+
+        Examples:
+            >>> users = await UserService.list()
+            >>> User.to_schema(users, UserOut)
+        """
+        items: list[Any] = rows if isinstance(rows, list) else list(rows)
+        adapter: TypeAdapter = _get_list_adapter(schema)
+
+        if items and isinstance(items[0], Row):
+            # Проверка словарей быстрее чтения атрибутов строк
+            return adapter.validate_python(cls.to_dicts(items))
+
+        return adapter.validate_python(items, from_attributes=True)
+
+    @classmethod
+    def _build_serializer(cls) -> None:
+        """Построение сериализатора по колонкам таблицы модели"""
+        mapper: Any = cls.__mapper__
+        keys: list[str] = []
+        attributes: list[str] = []
+
+        for column in cls.__table__.columns:  # type: ignore[attr-defined]
+            try:
+                attributes.append(mapper.get_property_by_column(column).key)
+            except UnmappedColumnError:
+                # Колонки, исключенные из маппинга, не сериализуются
+                continue
+
+            keys.append(column.name)
+
+        cls._COLUMN_KEYS = tuple(keys)
+        from_dict: Callable[[dict], Any] = itemgetter(*attributes)
+        from_attributes: Callable[[Any], Any] = attrgetter(*attributes)
+
+        def get_values(instance: Any) -> tuple:
+            try:
+                # Загруженные значения колонок лежат в __dict__, чтение минует дескрипторы атрибутов
+                return from_dict(instance.__dict__)
+            except KeyError:
+                return from_attributes(instance)
+
+        if len(attributes) == 1:
+            # Для одного атрибута itemgetter и attrgetter возвращают значение, а не кортеж
+            cls._VALUES_GETTER = staticmethod(lambda instance: (get_values(instance),))
+        else:
+            cls._VALUES_GETTER = staticmethod(get_values)
+
+
+@lru_cache
+def _get_list_adapter(schema: Type[Schema]) -> TypeAdapter:
+    """Валидатор списка схем. Создается один раз на схему"""
+    return TypeAdapter(list[schema])  # type: ignore[valid-type]
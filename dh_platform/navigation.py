@@ -0,0 +1,285 @@
+"""Модуль навигации по спискам"""
+
+__author__: str = "Старков Е.П."
+
+import base64
+import json
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Generic, List, Type, TypeVar
+
+from pydantic import BaseModel, TypeAdapter, ValidationError
+from pydantic_core import to_jsonable_python
+from sqlalchemy import Column, Select, func, inspect, select, tuple_
+
+from dh_platform.exceptions import InvalidNavigation
+from dh_platform.types import DictOrNone
+
+T = TypeVar("T")
+
+
+class Navigation(BaseModel):
+    """
+    Параметры навигации по списку
+
+    Attributes:
+        page (int): Номер страницы, начиная с 0. Используется при постраничной навигации
+        offset (int | None): Смещение. Имеет приоритет над page
+        limit (int | None): Количество записей на странице
+        cursor (str | None): Курсор навигации по ключу. Наличие ключа включает навигацию по ключу,
+            для первой страницы передается None
+        order_by (str | None): Поле сортировки. По-умолчанию - первичный ключ сервиса
+        desc (bool): Сортировка по убыванию
+        total (bool): Посчитать общее количество записей
+
+    Examples:
+        >>> {"page": 2, "limit": 30}  # LIMIT/OFFSET
+        >>> {"limit": 30, "cursor": None, "order_by": "created_at"}  # первая страница по ключу
+        >>> {"limit": 30, "cursor": page.next_cursor, "order_by": "created_at"}  # следующая
+    """
+
+    page: int = 0
+    offset: int | None = None
+    limit: int | None = None
+    cursor: str | None = None
+    order_by: str | None = None
+    desc: bool = False
+    total: bool = False
+
+    @property
+    def is_keyset(self) -> bool:
+        """Используется навигация по ключу"""
+        return "cursor" in self.model_fields_set
+
+
+@dataclass
+class Page(Generic[T]):
+    """
+    Страница результатов списка
+
+    Attributes:
+        items (List[T]): Записи страницы
+        has_more (bool): Есть ли следующая страница
+        next_cursor (str | None): Курсор следующей страницы при навигации по ключу
+        total (int | None): Общее количество записей. Считается только по запросу
+    """
+
+    items: List[T]
+    has_more: bool = False
+    next_cursor: str | None = None
+    total: int | None = None
+
+
+def parse_navigation(navigation: DictOrNone, max_limit: int | None = None) -> Navigation:
+    """
+    Разбор параметров навигации
+
+    Args:
+        navigation (dict | None): Навигация метода
+        max_limit (int | None): Максимальный размер страницы. Ограничивает limit и подставляется, если он не передан
+
+    Returns:
+        (Navigation): Параметры навигации
+
+    Raises:
+        InvalidNavigation: Параметры навигации некорректны
+    """
+    try:
+        nav: Navigation = Navigation.model_validate(navigation or {})
+    except ValidationError as ex:
+        raise InvalidNavigation(detail=str(ex)) from ex
+
+    if nav.page < 0 or (nav.offset is not None and nav.offset < 0) or (nav.limit is not None and nav.limit <= 0):
+        raise InvalidNavigation()
+
+    if max_limit is not None:
+        nav.limit = min(nav.limit or max_limit, max_limit)
+
+    return nav
+
+
+def get_order_columns(
+    model: Type, primary_key: str, order_by: str | None, keyset: bool = False
+) -> tuple[Column, Column]:
+    """
+    Получение колонок сортировки. Сортировка разрешена только по первичному ключу или индексированной колонке.
+    Навигация по ключу разрешена только по колонкам без NULL: сравнение ключа с NULL не выбирает записи
+
+    Args:
+        model (Type): Модель сущности
+        primary_key (str): Первичный ключ сервиса
+        order_by (str | None): Поле сортировки
+        keyset (bool): Сортировка для навигации по ключу
+
+    Returns:
+        (tuple[Column, Column]): Колонка сортировки и колонка первичного ключа
+
+    Raises:
+        InvalidNavigation: Поле отсутствует в модели, не индексировано или допускает NULL при навигации по ключу
+    """
+    columns = inspect(model).columns
+    key: str = order_by or primary_key
+
+    if key not in columns:
+        raise InvalidNavigation(detail=f"Сортировка по полю {key} невозможна")
+
+    column: Column = columns[key]
+
+    if not _is_indexed(column):
+        raise InvalidNavigation(detail=f"Сортировка по неиндексированному полю {key} невозможна")
+
+    if keyset and column.nullable:
+        raise InvalidNavigation(detail=f"Навигация по ключу по полю {key}, допускающему NULL, невозможна")
+
+    return column, columns[primary_key]
+
+
+def apply_navigation(query: Select, model: Type, primary_key: str, nav: Navigation, extra_rows: int = 0) -> Select:
+    """
+    Применение навигации к запросу
+
+    Args:
+        query (Select): Запрос
+        model (Type): Модель сущности
+        primary_key (str): Первичный ключ сервиса
+        nav (Navigation): Параметры навигации
+        extra_rows (int): Сколько записей запросить сверх лимита. Используется для определения наличия следующей
+            страницы
+
+    Returns:
+        (Select): Запрос с навигацией
+    """
+    limit: int | None = nav.limit
+    paginated: bool = limit is not None or bool(nav.offset) or bool(nav.page)
+
+    # Страницы без явной сортировки недетерминированы, поэтому по-умолчанию сортируем по первичному ключу
+    if nav.order_by is not None or nav.is_keyset or paginated:
+        order_column, pk_column = get_order_columns(model, primary_key, nav.order_by, nav.is_keyset)
+        order_columns: tuple = (order_column,) if order_column is pk_column else (order_column, pk_column)
+        query = query.order_by(*(column.desc() if nav.desc else column.asc() for column in order_columns))
+
+        if nav.is_keyset and nav.cursor is not None:
+            values: tuple = decode_cursor(nav.cursor, order_columns)
+            left = order_columns[0] if len(order_columns) == 1 else tuple_(*order_columns)
+            right = values[0] if len(order_columns) == 1 else tuple_(*values)
+            query = query.where(left < right if nav.desc else left > right)
+
+    if limit is not None:
+        query = query.limit(limit + extra_rows)
+
+    if not nav.is_keyset:
+        offset: int = nav.offset if nav.offset is not None else nav.page * (limit or 0)
+
+        if offset:
+            query = query.offset(offset)
+
+    return query
+
+
+def get_count_query(query: Select) -> Select:
+    """
+    Получение запроса количества записей по запросу списка
+
+    Args:
+        query (Select): Запрос списка без навигации
+
+    Returns:
+        (Select): Запрос SELECT count(*)
+    """
+    return select(func.count()).select_from(query.order_by(None).subquery())
+
+
+def make_page(items: List[T], model: Type, primary_key: str, nav: Navigation, total: int | None = None) -> Page[T]:
+    """
+    Формирование страницы по результатам запроса с лимитом limit + 1
+
+    Args:
+        items (List[T]): Результаты запроса
+        model (Type): Модель сущности
+        primary_key (str): Первичный ключ сервиса
+        nav (Navigation): Параметры навигации
+        total (int | None): Общее количество записей
+
+    Returns:
+        (Page[T]): Страница результатов
+    """
+    has_more: bool = nav.limit is not None and len(items) > nav.limit
+
+    if has_more:
+        items = items[: nav.limit]
+
+    next_cursor: str | None = None
+
+    if nav.is_keyset and has_more:
+        order_column, pk_column = get_order_columns(model, primary_key, nav.order_by, keyset=True)
+        order_columns: tuple = (order_column,) if order_column is pk_column else (order_column, pk_column)
+        next_cursor = encode_cursor(tuple(_get_item_value(items[-1], column.key) for column in order_columns))
+
+    return Page(items=items, has_more=has_more, next_cursor=next_cursor, total=total)
+
+
+def encode_cursor(values: tuple) -> str:
+    """
+    Кодирование значений ключа в непрозрачный курсор
+
+    Args:
+        values (tuple): Значения колонок сортировки последней записи
+
+    Returns:
+        (str): Курсор
+    """
+    raw: bytes = json.dumps(to_jsonable_python(values), separators=(",", ":")).encode()
+
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, columns: tuple[Column, ...]) -> tuple:
+    """
+    Декодирование курсора в значения колонок сортировки
+
+    Args:
+        cursor (str): Курсор
+        columns (tuple[Column, ...]): Колонки сортировки
+
+    Returns:
+        (tuple): Значения колонок
+
+    Raises:
+        InvalidNavigation: Курсор некорректен
+    """
+    try:
+        values: list = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+    except ValueError as ex:
+        raise InvalidNavigation(detail="Некорректный курсор навигации") from ex
+
+    if not isinstance(values, list) or len(values) != len(columns):
+        raise InvalidNavigation(detail="Некорректный курсор навигации")
+
+    try:
+        return tuple(_get_type_adapter(column).validate_python(value) for column, value in zip(columns, values))
+    except ValidationError as ex:
+        raise InvalidNavigation(detail="Некорректный курсор навигации") from ex
+
+
+def _is_indexed(column: Column) -> bool:
+    """Колонка является первичным ключом или первой колонкой индекса"""
+    if column.primary_key or column.index or column.unique:
+        return True
+
+    return any(next(iter(index.columns), None) is column for index in column.table.indexes)
+
+
+def _get_item_value(item: Any, key: str) -> Any:
+    """Получение значения поля записи"""
+    return getattr(item, key)
+
+
+@lru_cache
+def _get_type_adapter(column: Column) -> TypeAdapter:
+    """Валидатор значения колонки из курсора"""
+    try:
+        python_type: type = column.type.python_type
+    except NotImplementedError:
+        python_type = Any  # type: ignore[assignment]
+
+    return TypeAdapter(python_type)
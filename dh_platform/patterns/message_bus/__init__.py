@@ -2,5 +2,6 @@
 
 __author__: str = "Старков Е.П."
 
-from .common import message_bus
+from .common import ANY_EVENT, DispatchMode, MessageBus, message_bus
+from .dispatcher import OverflowPolicy
 from .events import *
@@ -1,55 +1,441 @@
+import asyncio
+import contextvars
 import logging
+import time
 from collections import defaultdict
-from typing import Dict, List, Any
+from enum import Enum
+from itertools import count
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Coroutine,
+    Dict,
+    List,
+    Literal,
+    NamedTuple,
+)
 
-from .events import Event, EventHandler, EventType
+from dh_platform.metrics import (
+    bus_dispatch_duration,
+    bus_handler_duration,
+    bus_handler_errors,
+    bus_published,
+    metrics,
+)
+
+from .dispatcher import OverflowPolicy, QueueDispatcher
+from .events import BatchEventHandler, Event, EventHandler, EventType
+
+if TYPE_CHECKING:
+    from .transport import Transport
 
 logger = logging.getLogger("dh_logger")
 
+# Подписка на все события
+ANY_EVENT: Literal["*"] = "*"
+
+
+class DispatchMode(str, Enum):
+    """
+    Режим вызова обработчиков события
+
+    Attributes:
+        SEQUENTIAL: Обработчики вызываются по очереди
+        CONCURRENT: Обработчики вызываются одновременно с ограничением параллельности
+        BACKGROUND: Обработчики вызываются в фоне, публикация не ожидает их завершения
+    """
+
+    SEQUENTIAL = "sequential"
+    CONCURRENT = "concurrent"
+    BACKGROUND = "background"
+
+
+class _Subscription(NamedTuple):
+    """
+    Подписка обработчика
+
+    Attributes:
+        handler (EventHandler): Обработчик
+        priority (int): Приоритет. Обработчики с большим приоритетом вызываются раньше
+        order (int): Порядковый номер подписки
+    """
+
+    handler: EventHandler
+    priority: int
+    order: int
+
 
 class MessageBus:
-    """Глобальная шина событий"""
+    """
+    Глобальная шина событий.
+    Обработчик, подписанный на родительский класс события, получает и события дочерних классов.
+    Ошибка или превышение времени одного обработчика не прерывает вызов остальных: исключение
+    логируется и возвращается в результатах на месте обработчика
 
-    def __init__(self):
-        self._subscriptions: Dict[EventType, List[EventHandler]] = defaultdict(list)
+    Args:
+        mode (DispatchMode): Режим вызова обработчиков по-умолчанию
+        concurrency_limit (int | None): Максимум одновременно выполняемых обработчиков одного события
+            в режимах CONCURRENT и BACKGROUND. None - без ограничения
+        handler_timeout (float | None): Время выполнения обработчика по-умолчанию, секунды.
+            Обработчик может задать свое время атрибутом timeout
+        max_background_tasks (int): Максимум фоновых публикаций. При превышении публикация ожидает
+            завершения одной из них
+        queue_size (int): Размер очереди publish_nowait
+        overflow_policy (OverflowPolicy): Поведение publish_nowait при заполненной очереди
+        workers (int): Количество воркеров, разбирающих очередь
+        transport (Transport | None): Транспорт для доставки событий другим процессам через broadcast
+    """
 
-    def subscribe(self, event_type: EventType, handler: EventHandler) -> None:
+    def __init__(
+        self,
+        mode: DispatchMode = DispatchMode.SEQUENTIAL,
+        concurrency_limit: int | None = None,
+        handler_timeout: float | None = None,
+        max_background_tasks: int = 1000,
+        queue_size: int = 10000,
+        overflow_policy: OverflowPolicy = OverflowPolicy.BLOCK,
+        workers: int = 4,
+        transport: "Transport | None" = None,
+    ):
+        self._subscriptions: Dict[EventType, List[_Subscription]] = defaultdict(list)
+        self._dispatch_table: Dict[EventType, List[EventHandler]] = {}
+        self._subscription_order: count = count()
+        self._mode: DispatchMode = mode
+        self._concurrency_limit: int | None = concurrency_limit
+        self._handler_timeout: float | None = handler_timeout
+        self._max_background_tasks: int = max_background_tasks
+        self._background_tasks: set[asyncio.Task] = set()
+        self._background_slots: asyncio.Semaphore | None = None
+        self._queue_options: dict[str, Any] = {"max_size": queue_size, "policy": overflow_policy, "workers": workers}
+        self._dispatcher: QueueDispatcher | None = None
+        self._transport: "Transport | None" = transport
+        self._dispatch_stats: dict[str, float] = {"count": 0, "total_seconds": 0.0, "max_seconds": 0.0}
+
+    def subscribe(self, event_type: EventType | Literal["*"], handler: EventHandler, priority: int = 0) -> None:
         """
         Регистрация обработчика для типа события
 
         Args:
-            event_type: тип события
+            event_type: тип события. Обработчик получит и события дочерних классов.
+                ANY_EVENT ("*") - подписка на все события
             handler: обработчик
+            priority: приоритет. Обработчики с большим приоритетом вызываются раньше,
+                с равным - в порядке подписки
 
         Examples:
-            >>> from dh_platform.patterns.message_bus import message_bus
+            >>> from dh_platform.patterns.message_bus import ANY_EVENT, message_bus
             >>>
             >>> message_bus.subscribe(UserCreatedEvent, UserCreatedHandler())
+            >>> message_bus.subscribe(ANY_EVENT, AuditHandler(), priority=10)
         """
         logger.info(f"Подписка на события с типом {event_type}")
-        self._subscriptions[event_type].append(handler)
+        subscription: _Subscription = _Subscription(handler, priority, next(self._subscription_order))
+        self._subscriptions[self._normalize_type(event_type)].append(subscription)
+        self._dispatch_table.clear()
+
+    def unsubscribe(self, event_type: EventType | Literal["*"], handler: EventHandler) -> bool:
+        """
+        Отмена подписки обработчика на тип события
+
+        Args:
+            event_type: тип события, указанный при подписке
+            handler: обработчик
+
+        Returns:
+            Подписка была найдена и удалена
+        """
+        subscriptions: List[_Subscription] = self._subscriptions.get(self._normalize_type(event_type), [])
+        remaining: List[_Subscription] = [item for item in subscriptions if item.handler is not handler]
+
+        if len(remaining) == len(subscriptions):
+            return False
 
-    async def publish(self, event: Event) -> list[Any]:
+        subscriptions[:] = remaining
+        self._dispatch_table.clear()
+
+        return True
+
+    async def publish(self, event: Event, mode: DispatchMode | None = None, timeout: float | None = None) -> list[Any]:
         """
         Публикация события всем подписчикам
 
         Args:
             event: Данные события
+            mode: Режим вызова обработчиков. По-умолчанию - режим шины
+            timeout: Время выполнения каждого обработчика, секунды. По-умолчанию - handler_timeout шины
+
+        Returns:
+            Результаты обработчиков в порядке подписки. На месте упавшего обработчика - его исключение.
+            В режиме BACKGROUND - пустой список
 
         Examples:
-            >>> from dh_platform.patterns.message_bus import message_bus
+            >>> from dh_platform.patterns.message_bus import DispatchMode, message_bus
             >>>
             >>> event = UserCreatedEvent(user_id="123", email="test@example.com")
             >>> await message_bus.publish(event)
+            >>> await message_bus.publish(event, mode=DispatchMode.CONCURRENT, timeout=5)
         """
         logger.info(f"Публикация события с данными {event}")
-        handlers = self._subscriptions.get(type(event), [])
-        result: list[Any] = []
+        handlers: List[EventHandler] = self._get_handlers(type(event))
+
+        if metrics.enabled:
+            bus_published.labels(type(event).__name__).inc()
+
+        mode = mode or self._mode
+        timeout = timeout if timeout is not None else self._handler_timeout
+
+        if not handlers:
+            return []
+
+        if mode == DispatchMode.BACKGROUND:
+            await self._spawn(self._dispatch_background(event, handlers, timeout))
+            return []
+
+        started: float = time.perf_counter()
+
+        if mode == DispatchMode.CONCURRENT:
+            results: list[Any] = await self._dispatch_concurrent(event, handlers, timeout)
+        else:
+            results = [await self._call_handler(handler, event, timeout) for handler in handlers]
+
+        self._record_dispatch(event, time.perf_counter() - started)
+
+        return results
+
+    async def publish_nowait(self, event: Event) -> bool:
+        """
+        Постановка события в очередь без ожидания обработчиков.
+        Очередь разбирают фоновые воркеры, они запускаются при первой публикации или через start().
+        Обработчики BatchEventHandler получают события пачками
+
+        Args:
+            event: Данные события
+
+        Returns:
+            Событие принято. False - событие отклонено политикой REJECT
+
+        Examples:
+            >>> await message_bus.publish_nowait(UserCreatedEvent(user_id="123", email="test@example.com"))
+        """
+        await self.start()
+        accepted: bool = await self._dispatcher.put(event)  # type: ignore[union-attr]
+
+        if accepted and metrics.enabled:
+            bus_published.labels(type(event).__name__).inc()
+
+        return accepted
+
+    async def broadcast(self, event: Event) -> None:
+        """
+        Публикация события во всех процессах, подключенных к транспорту, включая текущий.
+        Полученные из транспорта события ставятся в очередь publish_nowait
+
+        Args:
+            event: Данные события
+
+        Raises:
+            RuntimeError: Транспорт не задан
+
+        Examples:
+            >>> from dh_platform.patterns.message_bus.transport import PostgresTransport
+            >>>
+            >>> bus = MessageBus(transport=PostgresTransport())
+            >>> await bus.start()
+            >>> await bus.broadcast(UserCreatedEvent(user_id="123", email="test@example.com"))
+        """
+        if self._transport is None:
+            raise RuntimeError("Транспорт шины не задан")
+
+        await self.start()
+        await self._transport.send(event)
+
+    async def start(self) -> None:
+        """Запуск воркеров очереди событий и подключение к транспорту"""
+        if self._dispatcher is None:
+            self._dispatcher = QueueDispatcher(self, **self._queue_options)
+
+        self._dispatcher.start()
+
+        if self._transport is not None:
+            await self._transport.start(self.publish_nowait)
+
+    async def stop(self) -> None:
+        """
+        Остановка шины: отключение от транспорта, обработка оставшихся событий очереди,
+        отправка накопленных пачек и ожидание фоновых публикаций
+
+        Examples:
+            >>> @asynccontextmanager
+            >>> async def lifespan(_: FastAPI):
+            ...     await message_bus.start()
+            ...     yield
+            ...     await message_bus.stop()
+        """
+        if self._transport is not None:
+            await self._transport.stop()
+
+        if self._dispatcher is not None:
+            await self._dispatcher.stop()
+
+        await self.drain()
+
+    @property
+    def dispatch_stats(self) -> dict[str, float]:
+        """Количество обработанных событий, суммарное и максимальное время их обработки, секунды"""
+        return dict(self._dispatch_stats)
+
+    @property
+    def queue_stats(self) -> dict[str, int]:
+        """Счетчики очереди событий"""
+        return self._dispatcher.stats if self._dispatcher else {}
+
+    async def drain(self) -> None:
+        """
+        Ожидание завершения фоновых публикаций. Используется при остановке приложения
+
+        Examples:
+            >>> @asynccontextmanager
+            >>> async def lifespan(_: FastAPI):
+            ...     yield
+            ...     await message_bus.drain()
+        """
+        while self._background_tasks:
+            await asyncio.gather(*self._background_tasks, return_exceptions=True)
+
+    async def _dispatch_concurrent(
+        self, event: Event, handlers: List[EventHandler], timeout: float | None
+    ) -> list[Any]:
+        """Одновременный вызов обработчиков с ограничением параллельности"""
+        if self._concurrency_limit is None:
+            return list(await asyncio.gather(*(self._call_handler(handler, event, timeout) for handler in handlers)))
+
+        semaphore: asyncio.Semaphore = asyncio.Semaphore(self._concurrency_limit)
+
+        async def call_limited(handler: EventHandler) -> Any:
+            async with semaphore:
+                return await self._call_handler(handler, event, timeout)
+
+        return list(await asyncio.gather(*(call_limited(handler) for handler in handlers)))
+
+    async def _dispatch_background(self, event: Event, handlers: List[EventHandler], timeout: float | None) -> None:
+        started: float = time.perf_counter()
+        await self._dispatch_concurrent(event, handlers, timeout)
+        self._record_dispatch(event, time.perf_counter() - started)
+
+    def _record_dispatch(self, event: Event, duration: float) -> None:
+        """
+        Учет времени обработки события всеми обработчиками
+
+        Args:
+            event: данные события
+            duration: время обработки, секунды
+        """
+        stats: dict[str, float] = self._dispatch_stats
+        stats["count"] += 1
+        stats["total_seconds"] += duration
+        stats["max_seconds"] = max(stats["max_seconds"], duration)
+
+        if metrics.enabled:
+            bus_dispatch_duration.labels(type(event).__name__).observe(duration)
+
+        logger.debug("Событие %s %s обработано за %.6f с", type(event).__name__, event.event_id, duration)
+
+    def _get_handlers(self, event_type: EventType) -> List[EventHandler]:
+        """
+        Обработчики типа события с учетом подписок на родительские классы.
+        Таблица строится один раз на конкретный тип события и сбрасывается при изменении подписок
+
+        Args:
+            event_type: тип события
+
+        Returns:
+            Обработчики в порядке вызова. Список не должен изменяться вызывающим кодом
+        """
+        handlers: List[EventHandler] | None = self._dispatch_table.get(event_type)
+
+        if handlers is None:
+            subscriptions: List[_Subscription] = [
+                subscription for base in event_type.__mro__ for subscription in self._subscriptions.get(base, [])
+            ]
+            subscriptions.sort(key=lambda item: (-item.priority, item.order))
+            handlers = []
+
+            for subscription in subscriptions:
+                if not any(handler is subscription.handler for handler in handlers):
+                    handlers.append(subscription.handler)
+
+            self._dispatch_table[event_type] = handlers
+
+        return handlers
+
+    @staticmethod
+    def _normalize_type(event_type: EventType | Literal["*"]) -> EventType:
+        return Event if event_type == ANY_EVENT else event_type  # type: ignore[return-value]
+
+    async def _call_handler(self, handler: EventHandler, event: Event, timeout: float | None) -> Any:
+        """
+        Вызов обработчика с ограничением времени и перехватом исключения
+
+        Args:
+            handler: обработчик. Экземпляр EventHandler или асинхронная функция
+            event: данные события
+            timeout: время выполнения по-умолчанию, секунды
+
+        Returns:
+            Результат обработчика или его исключение
+        """
+        return await self._guard(handler, lambda: getattr(handler, "handle", handler)(event), timeout, type(event))
+
+    async def _call_batch_handler(self, handler: BatchEventHandler, events: list[Event]) -> Any:
+        """Вызов обработчика пачки событий с ограничением времени и перехватом исключения"""
+        return await self._guard(handler, lambda: handler.handle_batch(events), self._handler_timeout, type(events[0]))
+
+    async def _guard(
+        self, handler: Any, call: Callable[[], Coroutine], timeout: float | None, event_type: EventType
+    ) -> Any:
+        handler_timeout: float | None = getattr(handler, "timeout", None) or timeout
+        started: float = time.perf_counter()
+        failed: bool = False
+
+        try:
+            if handler_timeout is None:
+                return await call()
+
+            return await asyncio.wait_for(call(), handler_timeout)
+        except Exception as ex:
+            failed = True
+            logger.exception("Ошибка обработчика %r события %s", handler, event_type.__name__)
+            return ex
+        finally:
+            if metrics.enabled:
+                self._observe_handler(handler, event_type, time.perf_counter() - started, failed)
+
+    @staticmethod
+    def _observe_handler(handler: Any, event_type: EventType, duration: float, failed: bool) -> None:
+        """Учет времени выполнения и ошибок обработчика в метриках"""
+        name: str = getattr(handler, "__qualname__", None) or type(handler).__qualname__
+        bus_handler_duration.labels(event_type.__name__, name).observe(duration)
+
+        if failed:
+            bus_handler_errors.labels(event_type.__name__, name).inc()
+
+    async def _spawn(self, coroutine: Coroutine) -> None:
+        """Запуск фоновой публикации с ограничением количества одновременных задач"""
+        if self._background_slots is None:
+            self._background_slots = asyncio.Semaphore(self._max_background_tasks)
+
+        slots: asyncio.Semaphore = self._background_slots
+        await slots.acquire()
+        # Фоновая задача переживает вызывающий код, поэтому не наследует его контекст (сессию БД)
+        task: asyncio.Task = asyncio.create_task(coroutine, context=contextvars.Context())
+        self._background_tasks.add(task)
 
-        for handler in handlers:
-            result.append(await handler(event))
+        def on_done(done: asyncio.Task) -> None:
+            self._background_tasks.discard(done)
+            slots.release()
 
-        return result
+        task.add_done_callback(on_done)
 
 
 message_bus = MessageBus()
@@ -0,0 +1,193 @@
+import asyncio
+import contextvars
+import logging
+import time
+from enum import Enum
+from typing import TYPE_CHECKING, Any
+
+from .events import BatchEventHandler, Event
+
+if TYPE_CHECKING:
+    from .common import MessageBus
+
+logger = logging.getLogger("dh_logger")
+
+
+class OverflowPolicy(str, Enum):
+    """
+    Поведение при заполненной очереди событий
+
+    Attributes:
+        BLOCK: Публикация ожидает освобождения места
+        DROP_OLDEST: Самое старое событие очереди отбрасывается
+        REJECT: Новое событие отбрасывается
+    """
+
+    BLOCK = "block"
+    DROP_OLDEST = "drop_oldest"
+    REJECT = "reject"
+
+
+class _BatchBuffer:
+    """Накопитель пачки событий одного обработчика"""
+
+    def __init__(self, bus: "MessageBus", handler: BatchEventHandler) -> None:
+        self._bus: "MessageBus" = bus
+        self._handler: BatchEventHandler = handler
+        self._events: list[Event] = []
+        self._timer: asyncio.Task | None = None
+
+    async def add(self, event: Event) -> None:
+        self._events.append(event)
+
+        if len(self._events) >= self._handler.batch_size:
+            await self.flush()
+        elif self._timer is None:
+            # Таймер не должен наследовать сессию БД и идентификатор запроса публикующего кода
+            self._timer = asyncio.create_task(self._flush_later(), context=contextvars.Context())
+
+    async def flush(self) -> None:
+        if self._timer is not None and self._timer is not asyncio.current_task():
+            self._timer.cancel()
+
+        self._timer = None
+        events, self._events = self._events, []
+
+        if events:
+            await self._bus._call_batch_handler(self._handler, events)
+
+    async def _flush_later(self) -> None:
+        await asyncio.sleep(self._handler.linger)
+        await self.flush()
+
+
+class QueueDispatcher:
+    """
+    Фоновый обработчик очереди событий шины.
+    События из очереди разбирает пул воркеров, обработчики BatchEventHandler получают события пачками
+
+    Args:
+        bus (MessageBus): Шина событий
+        max_size (int): Размер очереди
+        policy (OverflowPolicy): Поведение при заполненной очереди
+        workers (int): Количество воркеров
+
+    Attributes:
+        enqueued (int): Количество принятых событий
+        dropped (int): Количество отброшенных старых событий (DROP_OLDEST)
+        rejected (int): Количество отклоненных новых событий (REJECT)
+    """
+
+    def __init__(
+        self,
+        bus: "MessageBus",
+        max_size: int = 10000,
+        policy: OverflowPolicy = OverflowPolicy.BLOCK,
+        workers: int = 4,
+    ) -> None:
+        self._bus: "MessageBus" = bus
+        self._queue: asyncio.Queue[Event] = asyncio.Queue(max_size)
+        self._policy: OverflowPolicy = policy
+        self._workers_count: int = workers
+        self._workers: list[asyncio.Task] = []
+        self._buffers: dict[int, _BatchBuffer] = {}
+        self.enqueued: int = 0
+        self.dropped: int = 0
+        self.rejected: int = 0
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """Счетчики очереди"""
+        return {
+            "enqueued": self.enqueued,
+            "dropped": self.dropped,
+            "rejected": self.rejected,
+            "size": self._queue.qsize(),
+        }
+
+    @property
+    def is_running(self) -> bool:
+        """Запущены ли воркеры"""
+        return bool(self._workers)
+
+    def start(self) -> None:
+        """Запуск воркеров"""
+        if not self._workers:
+            # Воркеры запускаются из первого publish_nowait и не должны наследовать его контекст:
+            # окружающую сессию БД и идентификатор запроса
+            self._workers = [
+                asyncio.create_task(self._work(), context=contextvars.Context()) for _ in range(self._workers_count)
+            ]
+
+    async def stop(self) -> None:
+        """Остановка воркеров после обработки всех событий очереди и отправки накопленных пачек"""
+        if self._workers:
+            await self._queue.join()
+
+        for worker in self._workers:
+            worker.cancel()
+
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+
+        for buffer in list(self._buffers.values()):
+            await buffer.flush()
+
+    async def put(self, event: Event) -> bool:
+        """
+        Постановка события в очередь с учетом политики переполнения
+
+        Args:
+            event (Event): Событие
+
+        Returns:
+            (bool): Событие принято
+        """
+        if self._policy == OverflowPolicy.BLOCK:
+            await self._queue.put(event)
+        elif self._queue.full() and self._policy == OverflowPolicy.REJECT:
+            self.rejected += 1
+            logger.warning("Очередь событий заполнена, событие %s отклонено", type(event).__name__)
+            return False
+        else:
+            if self._queue.full():
+                self._queue.get_nowait()
+                self._queue.task_done()
+                self.dropped += 1
+                logger.warning("Очередь событий заполнена, старое событие отброшено")
+
+            self._queue.put_nowait(event)
+
+        self.enqueued += 1
+
+        return True
+
+    async def _work(self) -> None:
+        while True:
+            event: Event = await self._queue.get()
+
+            try:
+                await self._dispatch(event)
+            except Exception:
+                logger.exception("Ошибка обработки события %s из очереди", type(event).__name__)
+            finally:
+                self._queue.task_done()
+
+    async def _dispatch(self, event: Event) -> None:
+        started: float = time.perf_counter()
+        handlers: list[Any] = self._bus._get_handlers(type(event))
+        regular: list[Any] = [handler for handler in handlers if not isinstance(handler, BatchEventHandler)]
+
+        if regular:
+            await self._bus._dispatch_concurrent(event, regular, self._bus._handler_timeout)
+
+        for handler in handlers:
+            if isinstance(handler, BatchEventHandler):
+                buffer: _BatchBuffer | None = self._buffers.get(id(handler))
+
+                if buffer is None:
+                    buffer = self._buffers[id(handler)] = _BatchBuffer(self._bus, handler)
+
+                await buffer.add(event)
+
+        self._bus._record_dispatch(event, time.perf_counter() - started)
@@ -1,39 +1,173 @@
+import random
+import time
+from datetime import datetime, timezone
 from typing import Any, Type
-from uuid import UUID, uuid4
+from uuid import UUID
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict, Field
+
+# Классы событий по полному имени. Используется для восстановления события из сериализованного вида
+_EVENT_TYPES: dict[str, Type["Event"]] = {}
+
+# Состояние генератора UUIDv7: время последнего идентификатора в мс и счетчик внутри миллисекунды
+_uuid7_state: list[int] = [0, 0]
+
+
+def uuid7() -> UUID:
+    """
+    Генерация упорядоченного по времени идентификатора UUIDv7 (RFC 9562).
+    Идентификаторы процесса строго возрастают: внутри одной миллисекунды увеличивается 12-битный счетчик
+
+    Returns:
+        Идентификатор
+    """
+    timestamp: int = time.time_ns() // 1_000_000
+    last_timestamp, counter = _uuid7_state
+
+    if timestamp <= last_timestamp:
+        timestamp, counter = last_timestamp, counter + 1
+
+        if counter > 0xFFF:
+            timestamp, counter = timestamp + 1, 0
+    else:
+        counter = random.getrandbits(11)
+
+    _uuid7_state[:] = timestamp, counter
+
+    return UUID(int=(timestamp << 80) | (0x7 << 76) | (counter << 64) | (0b10 << 62) | random.getrandbits(62))
 
 
 class Event(BaseModel):
     """
-    Базовый класс события
+    Базовый класс события.
+    События неизменяемы, поэтому один экземпляр передается всем обработчикам без копирования
+
+    Attributes:
+        event_id (UUID): Идентификатор события (UUIDv7). Присваивается один раз при создании.
+            Назван не id, чтобы не пересекаться с полями предметной области
+        occurred_at (datetime): Время создания события, UTC
+        monotonic_ns (int): Время создания события по монотонным часам процесса, нс. Не сериализуется:
+            у восстановленного из транспорта или outbox события это время восстановления
+        correlation_id (UUID | None): Идентификатор цепочки событий
+        causation_id (UUID | None): Идентификатор события-причины
+        schema_version (int): Версия схемы события. Переопределяется в классе события при изменении полей
 
     Examples:
         >>> class UserCreatedEvent(Event):
         ...     user_id: str
         ...     email: str
+        >>>
+        >>> class UserCreatedEventV2(Event):
+        ...     schema_version: int = 2
+        ...     user_id: str
     """
 
+    model_config = ConfigDict(frozen=True)
+
+    event_id: UUID = Field(default_factory=uuid7)
+    occurred_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    monotonic_ns: int = Field(default_factory=time.monotonic_ns, exclude=True)
+    correlation_id: UUID | None = None
+    causation_id: UUID | None = None
+    schema_version: int = 1
+
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs: Any) -> None:
+        super().__pydantic_init_subclass__(**kwargs)
+        _EVENT_TYPES[cls.get_event_name()] = cls
+
+    @classmethod
+    def get_event_name(cls) -> str:
+        """Полное имя класса события"""
+        return f"{cls.__module__}.{cls.__qualname__}"
+
     @property
     def uuid(self) -> UUID:
-        return uuid4()
+        """Идентификатор события. Оставлено для совместимости, используйте event_id"""
+        return self.event_id
+
+    def caused(self, event_type: Type["Event"], **data: Any) -> "Event":
+        """
+        Создание события, вызванного текущим, с наследованием цепочки
+
+        Args:
+            event_type: класс нового события
+            data: данные нового события
+
+        Returns:
+            Событие с correlation_id цепочки и causation_id текущего события
+
+        Examples:
+            >>> welcome = event.caused(WelcomeEmailSentEvent, email=event.email)
+        """
+        return event_type(correlation_id=self.correlation_id or self.event_id, causation_id=self.event_id, **data)
 
 
 class EventHandler:
     """
     Обработчик события
 
+    Attributes:
+        timeout (float | None): Время выполнения обработчика, секунды. По-умолчанию - время шины
+
     Examples:
         >>> class UserCreatedHandler(EventHandler):
         >>> async def handle(self, event: UserCreatedEvent):
         ...     print(f"User created: {event.email}")
     """
 
+    timeout: float | None = None
+
     async def handle(self, event: Event) -> Any:
         raise NotImplementedError
 
 
+class BatchEventHandler(EventHandler):
+    """
+    Обработчик, получающий события пачками при публикации через очередь (publish_nowait).
+    Пачка передается при накоплении batch_size событий или по истечении linger секунд с первого события пачки.
+    При обычной публикации обработчик получает пачку из одного события
+
+    Attributes:
+        batch_size (int): Максимальный размер пачки
+        linger (float): Максимальное время накопления пачки, секунды
+
+    Examples:
+        >>> class AuditHandler(BatchEventHandler):
+        ...     batch_size = 500
+        ...     linger = 0.5
+        ...
+        ...     async def handle_batch(self, events: list[UserCreatedEvent]):
+        ...         await AuditService.create_many(AuditCreate.from_event(event) for event in events)
+    """
+
+    batch_size: int = 100
+    linger: float = 0.1
+
+    async def handle(self, event: Event) -> Any:
+        return await self.handle_batch([event])
+
+    async def handle_batch(self, events: list[Event]) -> Any:
+        raise NotImplementedError
+
+
 EventType = Type[Event]
 
 
-__all__: list[str] = ["Event", "EventType", "EventHandler"]
+def get_event_type(name: str) -> EventType:
+    """
+    Получение класса события по полному имени
+
+    Args:
+        name: полное имя класса события (Event.get_event_name())
+
+    Returns:
+        Класс события
+
+    Raises:
+        KeyError: Класс события не импортирован
+    """
+    return _EVENT_TYPES[name]
+
+
+__all__: list[str] = ["Event", "EventType", "EventHandler", "BatchEventHandler", "get_event_type", "uuid7"]
@@ -0,0 +1,209 @@
+import asyncio
+import contextvars
+import logging
+from datetime import datetime
+from typing import Any, List
+
+from sqlalchemy import JSON, DateTime, Integer, String, Text, select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.sql import func
+
+from dh_platform.databases import (
+    commit_on_exit,
+    get_current_session,
+    session_scope,
+)
+from dh_platform.models import BaseModel, IDMixin
+
+from .common import DispatchMode, MessageBus, message_bus
+from .events import Event, get_event_type
+
+logger = logging.getLogger("dh_logger")
+
+
+class OutboxMessage(BaseModel, IDMixin):
+    """
+    Модель события в исходящей очереди (transactional outbox)
+
+    Attributes:
+        idempotency_key (str): Ключ идемпотентности. Повторная запись с тем же ключом игнорируется
+        event_type (str): Полное имя класса события
+        payload (dict): Данные события
+        created_at (datetime): Дата записи
+        processed_at (datetime | None): Дата успешной доставки
+        attempts (int): Количество неудачных попыток доставки
+        last_error (str | None): Последняя ошибка доставки
+    """
+
+    idempotency_key: Mapped[str] = mapped_column(String(64), unique=True)
+    event_type: Mapped[str] = mapped_column(String(255))
+    payload: Mapped[dict] = mapped_column(JSON)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
+    processed_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True, index=True)
+    attempts: Mapped[int] = mapped_column(Integer, default=0)
+    last_error: Mapped[str | None] = mapped_column(Text, nullable=True)
+
+
+class Outbox:
+    """
+    Исходящая очередь событий в БД.
+    Событие, записанное внутри unit_of_work или метода сервиса (в том числе в его хуках), попадает в транзакцию
+    открытой сессии и записывается, только если она зафиксирована. Доставка в шину выполняется фоновым
+    ретранслятором не менее одного раза.
+    Несколько экземпляров ретранслятора разбирают очередь без пересечений благодаря FOR UPDATE SKIP LOCKED
+
+    Args:
+        bus (MessageBus): Шина, в которую доставляются события
+        mode (DispatchMode): Режим вызова обработчиков при доставке. Событие считается доставленным
+            по результатам обработчиков, поэтому режим BACKGROUND не допускается
+        batch_size (int): Количество событий, забираемых за один проход
+        poll_interval (float): Пауза между проходами при пустой очереди, секунды
+        max_attempts (int): Максимум попыток доставки события
+
+    Raises:
+        ValueError: Передан режим BACKGROUND
+
+    Examples:
+        >>> from dh_platform.databases import unit_of_work
+        >>> from dh_platform.patterns.message_bus.outbox import Outbox
+        >>>
+        >>> outbox = Outbox()
+        >>>
+        >>> async with unit_of_work():
+        ...     user = await UserService.create(user_data)
+        ...     await outbox.add(UserCreatedEvent(user_id=user.id, email=user.email))
+        >>>
+        >>> @asynccontextmanager
+        >>> async def lifespan(_: FastAPI):
+        ...     outbox.start()
+        ...     yield
+        ...     await outbox.stop()
+    """
+
+    def __init__(
+        self,
+        bus: MessageBus = message_bus,
+        batch_size: int = 100,
+        poll_interval: float = 1.0,
+        max_attempts: int = 10,
+        mode: DispatchMode = DispatchMode.SEQUENTIAL,
+    ) -> None:
+        if mode == DispatchMode.BACKGROUND:
+            raise ValueError("Доставка из исходящей очереди требует ожидания обработчиков")
+
+        self._bus: MessageBus = bus
+        self._mode: DispatchMode = mode
+        self._batch_size: int = batch_size
+        self._poll_interval: float = poll_interval
+        self._max_attempts: int = max_attempts
+        self._task: asyncio.Task | None = None
+
+    async def add(self, event: Event, idempotency_key: str | None = None) -> None:
+        """
+        Запись события в очередь.
+        Внутри открытой сессии (unit_of_work, метод сервиса и его хуки) запись входит в ее транзакцию
+        и фиксируется вместе с ней, при откате событие не записывается. Иначе запись выполняется отдельной
+        транзакцией
+
+        Args:
+            event (Event): Событие
+            idempotency_key (str | None): Ключ идемпотентности. По-умолчанию - идентификатор события
+
+        Warnings:
+            Хуки _after_* вызываются после фиксации изменения сущности, поэтому событие из них фиксируется
+            при выходе из метода сервиса отдельно от изменения. Для атомарной записи вызывайте add
+            в хуке _before_* или вместе с сервисом внутри unit_of_work
+        """
+        ambient: AsyncSession | None = get_current_session()
+
+        async with session_scope() as session:
+            dialect = sqlite if session.bind.dialect.name == "sqlite" else postgresql
+            await session.execute(
+                dialect.insert(OutboxMessage)
+                .values(
+                    idempotency_key=idempotency_key or event.event_id.hex,
+                    event_type=event.get_event_name(),
+                    payload=event.model_dump(mode="json"),
+                    attempts=0,
+                )
+                .on_conflict_do_nothing(index_elements=[OutboxMessage.idempotency_key])
+            )
+
+            if session is ambient:
+                # Транзакцию фиксирует открывший сессию код: здесь фиксация записала бы и его изменения
+                commit_on_exit(session)
+            else:
+                await session.commit()
+
+    async def relay(self) -> int:
+        """
+        Один проход ретранслятора: доставка пачки событий в шину.
+        Событие отмечается доставленным, только если все обработчики завершились без ошибок
+
+        Returns:
+            (int): Количество обработанных событий
+        """
+        async with session_scope(share=False) as session:
+            messages: List[OutboxMessage] = await self._lock_batch(session)
+
+            for message in messages:
+                error: str | None = await self._deliver(message)
+
+                if error is None:
+                    message.processed_at = datetime.now()
+                else:
+                    message.attempts += 1
+                    message.last_error = error
+
+            await session.commit()
+
+        return len(messages)
+
+    def start(self) -> None:
+        """Запуск фонового ретранслятора"""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run(), context=contextvars.Context())
+
+    async def stop(self) -> None:
+        """Остановка фонового ретранслятора"""
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                processed: int = await self.relay()
+            except Exception:
+                logger.exception("Ошибка ретрансляции исходящих событий")
+                processed = 0
+
+            if processed < self._batch_size:
+                await asyncio.sleep(self._poll_interval)
+
+    async def _lock_batch(self, session: AsyncSession) -> List[OutboxMessage]:
+        query = (
+            select(OutboxMessage)
+            .where(OutboxMessage.processed_at.is_(None), OutboxMessage.attempts < self._max_attempts)
+            .order_by(OutboxMessage.id)
+            .limit(self._batch_size)
+            .with_for_update(skip_locked=True)
+        )
+
+        return list((await session.scalars(query)).all())
+
+    async def _deliver(self, message: OutboxMessage) -> str | None:
+        """Доставка события в шину. Возвращает текст ошибки или None"""
+        try:
+            event: Event = get_event_type(message.event_type).model_validate(message.payload)
+        except Exception as ex:
+            logger.exception("Не удалось восстановить событие %s из очереди", message.event_type)
+            return repr(ex)
+
+        results: list[Any] = await self._bus.publish(event, mode=self._mode)
+        errors: list[Exception] = [result for result in results if isinstance(result, Exception)]
+
+        return repr(errors[0]) if errors else None
@@ -0,0 +1,317 @@
+import asyncio
+import contextvars
+import logging
+from abc import ABC, abstractmethod
+from collections import defaultdict
+from typing import Any, Awaitable, Callable, Iterable
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from dh_platform.databases import DEFAULT_ENGINE, get_engine
+
+from .events import Event, get_event_type
+
+logger = logging.getLogger("dh_logger")
+
+# Разделитель имени события и данных в строке сообщения
+_NAME_SEPARATOR: str = "\t"
+# Разделитель событий в пачке. model_dump_json не выводит переводы строк
+_EVENT_SEPARATOR: str = "\n"
+# Максимальный размер данных NOTIFY в PostgreSQL - 8000 байт
+PG_MAX_PAYLOAD: int = 7999
+
+Receiver = Callable[[Event], Awaitable[Any]]
+
+
+def serialize_events(events: Iterable[Event], max_size: int | None = None) -> list[str]:
+    """
+    Сериализация событий в сообщения транспорта.
+    События объединяются в сообщения размером не более max_size байт
+
+    Args:
+        events: события
+        max_size: максимальный размер сообщения в байтах. None - без ограничения
+
+    Returns:
+        Сообщения
+    """
+    messages: list[str] = []
+    lines: list[str] = []
+    size: int = 0
+
+    for event in events:
+        line: str = f"{event.get_event_name()}{_NAME_SEPARATOR}{event.model_dump_json()}"
+        line_size: int = len(line.encode())
+
+        if max_size is not None and line_size > max_size:
+            logger.error("Событие %s превышает размер сообщения транспорта и не отправлено", type(event).__name__)
+            continue
+
+        if lines and max_size is not None and size + line_size > max_size:
+            messages.append(_EVENT_SEPARATOR.join(lines))
+            lines, size = [], 0
+
+        lines.append(line)
+        size += line_size + 1
+
+    if lines:
+        messages.append(_EVENT_SEPARATOR.join(lines))
+
+    return messages
+
+
+def deserialize_events(message: str) -> list[Event]:
+    """
+    Восстановление событий из сообщения транспорта.
+    События, классы которых не импортированы в процессе, пропускаются
+
+    Args:
+        message: сообщение
+
+    Returns:
+        События
+    """
+    events: list[Event] = []
+
+    for line in message.split(_EVENT_SEPARATOR):
+        name, _, data = line.partition(_NAME_SEPARATOR)
+
+        try:
+            events.append(get_event_type(name).model_validate_json(data))
+        except KeyError:
+            logger.warning("Получено событие неизвестного типа %s", name)
+        except Exception:
+            logger.exception("Ошибка восстановления события %s", name)
+
+    return events
+
+
+class Transport(ABC):
+    """
+    Транспорт событий между процессами.
+    Отправляемые события накапливаются и уходят пачкой при достижении batch_size или через linger секунд
+
+    Args:
+        batch_size: максимум событий в пачке
+        linger: время ожидания пачки, секунды
+    """
+
+    # Максимальный размер сообщения в байтах. None - без ограничения
+    max_message_size: int | None = None
+
+    def __init__(self, batch_size: int = 100, linger: float = 0.01) -> None:
+        self._batch_size: int = batch_size
+        self._linger: float = linger
+        self._buffer: list[Event] = []
+        self._timer: asyncio.Task | None = None
+        self._receiver: Receiver | None = None
+
+    async def start(self, receiver: Receiver) -> None:
+        """
+        Подключение к транспорту
+
+        Args:
+            receiver: получатель событий других процессов
+        """
+        if self._receiver is None:
+            self._receiver = receiver
+            await self._connect()
+
+    async def stop(self) -> None:
+        """Отправка накопленных событий и отключение от транспорта"""
+        await self.flush()
+
+        if self._receiver is not None:
+            await self._close()
+            self._receiver = None
+
+    async def send(self, event: Event) -> None:
+        """
+        Постановка события в пачку на отправку
+
+        Args:
+            event: событие
+        """
+        self._buffer.append(event)
+
+        if len(self._buffer) >= self._batch_size:
+            await self.flush()
+        elif self._timer is None:
+            # Таймер не должен наследовать сессию БД и идентификатор запроса отправителя
+            self._timer = asyncio.create_task(self._flush_later(), context=contextvars.Context())
+
+    async def flush(self) -> None:
+        """Отправка накопленных событий"""
+        if self._timer is not None and self._timer is not asyncio.current_task():
+            self._timer.cancel()
+
+        self._timer = None
+        events, self._buffer = self._buffer, []
+
+        if events:
+            await self._send(serialize_events(events, self.max_message_size))
+
+    async def _deliver(self, message: str) -> None:
+        """Передача событий полученного сообщения получателю"""
+        if self._receiver is None:
+            return
+
+        for event in deserialize_events(message):
+            await self._receiver(event)
+
+    async def _flush_later(self) -> None:
+        await asyncio.sleep(self._linger)
+
+        try:
+            await self.flush()
+        except Exception:
+            logger.exception("Ошибка отправки пачки событий")
+
+    @abstractmethod
+    async def _connect(self) -> None:
+        """Подключение и подписка на сообщения"""
+
+    @abstractmethod
+    async def _close(self) -> None:
+        """Отключение"""
+
+    @abstractmethod
+    async def _send(self, messages: list[str]) -> None:
+        """
+        Отправка сообщений
+
+        Args:
+            messages: сериализованные пачки событий
+        """
+
+
+class LoopbackTransport(Transport):
+    """
+    Транспорт в памяти процесса. Сообщения получают все подключенные транспорты канала,
+    включая отправителя. Используется в тестах вместо транспорта через БД
+
+    Args:
+        channel: имя канала
+        batch_size: максимум событий в пачке
+        linger: время ожидания пачки, секунды
+
+    Examples:
+        >>> bus_a = MessageBus(transport=LoopbackTransport())
+        >>> bus_b = MessageBus(transport=LoopbackTransport())
+        >>> await bus_a.start(); await bus_b.start()
+        >>> await bus_a.broadcast(UserCreatedEvent(user_id="123", email="test@example.com"))
+    """
+
+    _channels: dict[str, list["LoopbackTransport"]] = defaultdict(list)
+
+    def __init__(self, channel: str = "dh_events", batch_size: int = 100, linger: float = 0.01) -> None:
+        super().__init__(batch_size, linger)
+        self._channel: str = channel
+
+    async def _connect(self) -> None:
+        self._channels[self._channel].append(self)
+
+    async def _close(self) -> None:
+        self._channels[self._channel].remove(self)
+
+    async def _send(self, messages: list[str]) -> None:
+        for transport in list(self._channels[self._channel]):
+            for message in messages:
+                await transport._deliver(message)
+
+
+class PostgresTransport(Transport):
+    """
+    Транспорт через LISTEN/NOTIFY PostgreSQL.
+    Использует движок SQLAlchemy и драйвер asyncpg: для прослушивания канала из пула берется отдельное
+    соединение, пачки событий отправляются одной транзакцией. Сообщения получают все процессы,
+    подключенные к каналу, включая отправителя. Доставка не гарантируется: события, отправленные
+    во время переподключения, теряются. Для гарантированной доставки используется Outbox
+
+    Args:
+        channel: имя канала
+        engine_name: имя движка в реестре
+        batch_size: максимум событий в пачке
+        linger: время ожидания пачки, секунды
+
+    Examples:
+        >>> from dh_platform.patterns.message_bus import MessageBus
+        >>> from dh_platform.patterns.message_bus.transport import PostgresTransport
+        >>>
+        >>> message_bus = MessageBus(transport=PostgresTransport())
+    """
+
+    max_message_size: int | None = PG_MAX_PAYLOAD
+
+    def __init__(
+        self,
+        channel: str = "dh_events",
+        engine_name: str = DEFAULT_ENGINE,
+        batch_size: int = 100,
+        linger: float = 0.01,
+    ) -> None:
+        super().__init__(batch_size, linger)
+        self._channel: str = channel
+        self._engine_name: str = engine_name
+        self._connection: AsyncConnection | None = None
+        self._inbox: asyncio.Queue[str] = asyncio.Queue()
+        self._reader: asyncio.Task | None = None
+
+    async def _connect(self) -> None:
+        self._connection = await get_engine(self._engine_name).connect()
+        raw_connection: Any = (await self._connection.get_raw_connection()).driver_connection
+        await raw_connection.add_listener(self._channel, self._on_notify)
+        raw_connection.add_termination_listener(self._on_terminate)
+
+        if self._reader is None:
+            self._reader = asyncio.create_task(self._read(), context=contextvars.Context())
+
+    async def _close(self) -> None:
+        if self._reader is not None:
+            self._reader.cancel()
+            await asyncio.gather(self._reader, return_exceptions=True)
+            self._reader = None
+
+        if self._connection is not None:
+            connection, self._connection = self._connection, None
+            # Соединение с подпиской на канал не возвращается в пул
+            await connection.invalidate()
+            await connection.close()
+
+    async def _send(self, messages: list[str]) -> None:
+        async with get_engine(self._engine_name).begin() as connection:
+            await connection.execute(
+                text("SELECT pg_notify(:channel, :payload)"),
+                [{"channel": self._channel, "payload": message} for message in messages],
+            )
+
+    def _on_notify(self, connection: Any, pid: int, channel: str, payload: str) -> None:
+        self._inbox.put_nowait(payload)
+
+    def _on_terminate(self, connection: Any) -> None:
+        if self._receiver is not None and self._connection is not None:
+            logger.warning("Соединение прослушивания канала %s потеряно, переподключение", self._channel)
+            asyncio.get_running_loop().create_task(self._reconnect(), context=contextvars.Context())
+
+    async def _reconnect(self) -> None:
+        if self._connection is not None:
+            connection, self._connection = self._connection, None
+            await asyncio.gather(connection.invalidate(), connection.close(), return_exceptions=True)
+
+        while self._receiver is not None:
+            try:
+                await self._connect()
+                return
+            except Exception:
+                logger.exception("Ошибка подключения к каналу %s", self._channel)
+                await asyncio.sleep(1)
+
+    async def _read(self) -> None:
+        while True:
+            message: str = await self._inbox.get()
+
+            try:
+                await self._deliver(message)
+            except Exception:
+                logger.exception("Ошибка обработки сообщения канала %s", self._channel)
@@ -0,0 +1,115 @@
+"""Модуль выборки колонок"""
+
+__author__: str = "Старков Е.П."
+
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Iterable, Type
+
+from sqlalchemy import Column, inspect
+from sqlalchemy.orm import defer, load_only
+from sqlalchemy.sql.base import ExecutableOption
+
+from dh_platform.exceptions import InvalidFields
+
+
+@dataclass(frozen=True)
+class LoadProfile:
+    """
+    Профиль загрузки сущности: набор колонок, загружаемых запросом.
+    Сущности загружаются как модели, но без лишних колонок (например, больших текстовых и JSON полей)
+
+    Attributes:
+        load_only (tuple[str, ...]): Загружать только эти колонки. Первичный ключ загружается всегда
+        defer (tuple[str, ...]): Не загружать эти колонки
+        raiseload (bool): Выбрасывать исключение при обращении к незагруженной колонке вместо запроса к БД.
+            В асинхронной сессии неявная загрузка невозможна
+
+    Examples:
+        >>> class ArticleService(BaseService):
+        ...     _MODEL = Article
+        ...     _LOAD_PROFILES = {
+        ...         "short": LoadProfile(load_only=("title", "created_at")),
+        ...         "no_body": LoadProfile(defer=("body", "attachments")),
+        ...     }
+        >>>
+        >>> await ArticleService.list(profile="short")
+    """
+
+    load_only: tuple[str, ...] = ()
+    defer: tuple[str, ...] = ()
+    raiseload: bool = True
+
+    def __post_init__(self) -> None:
+        # Профиль используется как ключ кэша опций, поэтому списки приводятся к кортежам
+        object.__setattr__(self, "load_only", tuple(self.load_only))
+        object.__setattr__(self, "defer", tuple(self.defer))
+
+
+def normalize_fields(fields: Iterable[str]) -> tuple[str, ...]:
+    """
+    Приведение списка полей к кортежу без повторов с сохранением порядка
+
+    Args:
+        fields (Iterable[str]): Поля
+
+    Returns:
+        (tuple[str, ...]): Поля
+    """
+    return (fields,) if isinstance(fields, str) else tuple(dict.fromkeys(fields))
+
+
+@lru_cache
+def get_columns(model: Type, fields: tuple[str, ...]) -> tuple[Column, ...]:
+    """
+    Получение колонок модели по названиям полей. Колонки ищутся один раз на набор полей
+
+    Args:
+        model (Type): Модель сущности
+        fields (tuple[str, ...]): Поля
+
+    Returns:
+        (tuple[Column, ...]): Атрибуты колонок модели для select(...)
+
+    Raises:
+        InvalidFields: Поля не переданы или отсутствуют в модели
+
+    Examples:
+        >>> await session.execute(select(*get_columns(UserModel, ("id", "name"))))
+    """
+    if not fields:
+        raise InvalidFields(detail="Не переданы поля выборки")
+
+    columns = inspect(model).column_attrs
+
+    for field in fields:
+        if field not in columns:
+            raise InvalidFields(detail=f"Выборка поля {field} невозможна")
+
+    return tuple(getattr(model, field) for field in fields)
+
+
+@lru_cache
+def get_load_options(model: Type, profile: LoadProfile) -> tuple[ExecutableOption, ...]:
+    """
+    Получение опций загрузки запроса по профилю. Опции строятся один раз на профиль
+
+    Args:
+        model (Type): Модель сущности
+        profile (LoadProfile): Профиль загрузки
+
+    Returns:
+        (tuple[ExecutableOption, ...]): Опции для select(model).options(...)
+
+    Raises:
+        InvalidFields: Поля профиля отсутствуют в модели
+    """
+    options: list[ExecutableOption] = []
+
+    if profile.load_only:
+        options.append(load_only(*get_columns(model, profile.load_only), raiseload=profile.raiseload))
+
+    if profile.defer:
+        options.extend(defer(column, raiseload=profile.raiseload) for column in get_columns(model, profile.defer))
+
+    return tuple(options)
@@ -4,16 +4,66 @@
 __author__: str = "Старков Е.П."
 
 from datetime import datetime
-from typing import Generic, List, Type, TypeVar
+from itertools import islice
+from typing import (
+    Any,
+    AsyncIterator,
+    Generic,
+    Iterable,
+    Iterator,
+    List,
+    Type,
+    TypeVar,
+)
 
 from pydantic import BaseModel as PydanticBaseModel
-from sqlalchemy import Result, select, Select
+from sqlalchemy import (
+    Result,
+    Select,
+    delete,
+    func,
+    insert,
+    inspect,
+    literal,
+    select,
+    text,
+    update,
+)
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql.base import ExecutableOption
 
-from dh_platform.databases import add_session_db
+from dh_platform.cache import EntityCache
+from dh_platform.databases import (
+    add_session_db,
+    commit_session,
+    in_write_session,
+    on_commit,
+    session_scope,
+)
+from dh_platform.exceptions import (
+    EntityNotFound,
+    EntityVersionConflict,
+    InvalidFields,
+    UpdateAllowedById,
+)
+from dh_platform.filters import SEPARATOR, get_filter_compiler
 from dh_platform.models import BaseModel
+from dh_platform.navigation import (
+    Navigation,
+    Page,
+    apply_navigation,
+    get_count_query,
+    get_order_columns,
+    make_page,
+    parse_navigation,
+)
+from dh_platform.projections import (
+    LoadProfile,
+    get_columns,
+    get_load_options,
+    normalize_fields,
+)
 from dh_platform.types import DictOrNone
-from dh_platform.exceptions import EntityNotFound, UpdateAllowedById
 
 M = TypeVar("M", bound=BaseModel)
 
@@ -27,7 +77,6 @@ class BaseService(Generic[M]):
 
     Examples:
         >>> from dh_platform.services import BaseService
-        >>> from dh_platform.models import BaseModel
         >>>
         >>>
         >>> class UserModel(BaseModel):
@@ -36,15 +85,30 @@ class BaseService(Generic[M]):
         >>>
         >>> class UserService(BaseService):
         ...     _MODEL = UserModel
+        ...     _LOADER_OPTIONS = {
+        ...         "default": (selectinload(UserModel.roles),),
+        ...         "list": (selectinload(UserModel.roles), raiseload("*")),
+        ...     }
         >>>
     """
 
     _MODEL: Type[M]
     _PRIMARY_KEY: str = "id"
+    _BULK_CHUNK_SIZE: int = 1000
+    _MAX_LIMIT: int | None = None
+    _STREAM_BATCH_SIZE: int = 1000
+    _CACHE: EntityCache | None = None
+    _FAST_UPDATE: bool = False
+    _VERSION_COLUMN: str | None = None
+    _LOAD_PROFILES: dict[str, LoadProfile] = {}
+    # Опции загрузки связей по методам: list (list, list_page), read (read, get_one_by_filter), stream.
+    # Опции "default" используются для методов без своих опций
+    _LOADER_OPTIONS: dict[str, tuple[ExecutableOption, ...]] = {}
+    _EXCLUDE_DELETED: bool = False
 
     @classmethod
     @add_session_db
-    async def create(cls, data: PydanticBaseModel, session: AsyncSession) -> M: # type: ignore[call-arg]
+    async def create(cls, data: PydanticBaseModel, session: AsyncSession) -> M:  # type: ignore[call-arg]
         """
         Создание сущности и запись ее в БД
 
@@ -72,14 +136,40 @@ class BaseService(Generic[M]):
         new_entity: M = cls._get_new_entity(data_dict)
 
         session.add(new_entity)
-        await session.commit()
+        await commit_session(session)
         await cls._after_create(new_entity, data_dict)
 
         return new_entity
 
     @classmethod
     @add_session_db
-    async def update(cls, new_data: PydanticBaseModel, session: AsyncSession):
+    async def update(
+        cls,
+        new_data: PydanticBaseModel,
+        fast: bool | None = None,
+        session: AsyncSession = None,  # type: ignore[call-arg]
+    ):
+        """
+        Обновление сущности по первичному ключу.
+        В быстром режиме выполняется один UPDATE ... RETURNING только по переданным полям без предварительного
+        чтения записи. Быстрый режим не используется, если в сервисе переопределен _before_update
+
+        Args:
+            new_data (PydanticBaseModel): Данные сущности с первичным ключом
+            fast (bool | None): Использовать быстрый режим. По-умолчанию - _FAST_UPDATE
+            session (AsyncSession): Сессия подключения к БД
+
+        Returns:
+            (M): Данные модели
+
+        Raises:
+            UpdateAllowedById: В данных нет первичного ключа
+            EntityNotFound: Сущность не найдена
+            EntityVersionConflict: Версия записи не совпадает с переданной
+        """
+        if cls._can_update_fast(fast):
+            return await cls._update_fast(new_data, session)
+
         data_dict: dict = new_data.model_dump()
 
         if data_dict.get(cls._PRIMARY_KEY) is None:
@@ -89,23 +179,63 @@ class BaseService(Generic[M]):
 
         await cls._before_update(data_dict, old_data)
 
+        version: int | None = cls._check_version(old_data, data_dict)
+
         for key, value in data_dict.items():
             if hasattr(old_data, key):
                 setattr(old_data, key, value)
 
+        if version is not None:
+            setattr(old_data, cls._VERSION_COLUMN, version + 1)
+
         if hasattr(old_data, "updated_at"):
             old_data.updated_at = datetime.now()
 
         session.add(old_data)
-        await session.commit()
+        await commit_session(session)
+        await cls._invalidate_cache(data_dict.get(cls._PRIMARY_KEY))
         await cls._after_update(old_data)
 
         return old_data
 
     @classmethod
-    @add_session_db
-    async def read(cls, entity_id: int, session: AsyncSession) -> M:
-        data: M = await cls.get_one_by_filter(id=entity_id)
+    @add_session_db(readonly=True)
+    async def read(
+        cls,
+        entity_id: int,
+        fields: Iterable[str] | None = None,
+        profile: str | None = None,
+        options: Iterable[ExecutableOption] | None = None,
+        session: AsyncSession = None,  # type: ignore[call-arg]
+    ) -> M:
+        """
+        Получение сущности по первичному ключу.
+        Если у сервиса задан _CACHE, сущность берется из кэша. Внутри пишущей сессии, а также при выборке
+        полей, профиля загрузки или опций загрузки вызова кэш не используется
+
+        Args:
+            entity_id (int): Идентификатор сущности
+            fields (Iterable[str] | None): Поля выборки. Вместо модели возвращается строка (Row) только с этими полями
+            profile (str | None): Профиль загрузки из _LOAD_PROFILES
+            options (Iterable[ExecutableOption] | None): Опции загрузки связей. Заменяют опции метода
+                из _LOADER_OPTIONS
+            session (AsyncSession): Сессия подключения к БД
+
+        Returns:
+            (M): Данные модели или строка с полями выборки
+
+        Raises:
+            EntityNotFound: Сущность не найдена
+            InvalidFields: Поля отсутствуют в модели или профиль не найден
+        """
+        filters: dict = {cls._PRIMARY_KEY: entity_id}
+
+        if fields is not None or profile is not None or options is not None:
+            data: M = await cls.get_one_by_filter(_fields=fields, _profile=profile, _options=options, **filters)
+        elif cls._CACHE is not None and not in_write_session():
+            data = await cls._CACHE.get_or_load(cls._get_cache_key(entity_id), lambda: cls.get_one_by_filter(**filters))
+        else:
+            data = await cls.get_one_by_filter(**filters)
 
         if not data:
             raise EntityNotFound()
@@ -132,22 +262,205 @@ class BaseService(Generic[M]):
         else:
             data.deleted_at = datetime.now()
             session.add(data)
-            await session.commit()
+
+        await commit_session(session)
+        await cls._invalidate_cache(entity_id)
 
         await cls._after_delete(data)
 
     @classmethod
     @add_session_db
+    async def create_many(
+        cls,
+        data: Iterable[PydanticBaseModel],
+        chunk_size: int | None = None,
+        session: AsyncSession = None,  # type: ignore[call-arg]
+    ) -> List[M]:
+        """
+        Массовое создание сущностей.
+        Записи вставляются многострочным INSERT, фиксация транзакции производится один раз на пачку
+
+        Args:
+            data (Iterable[PydanticBaseModel]): Данные о сущностях
+            chunk_size (int | None): Размер пачки. По-умолчанию - _BULK_CHUNK_SIZE
+            session (AsyncSession): Сессия подключения к БД
+
+        Returns:
+            (List[M]): Созданные сущности
+
+        Examples:
+            >>> await UserService.create_many([UserCreate(name="Иван"), UserCreate(name="Петр")])
+        """
+        result: List[M] = []
+
+        for chunk in cls._chunked(data, chunk_size):
+            data_list: List[dict] = [item.model_dump() for item in chunk]
+            await cls._before_create_many(data_list)
+
+            entities: List[M] = list(
+                await session.scalars(
+                    # Без sort_by_parameter_order порядок строк RETURNING не совпадает с порядком данных
+                    insert(cls._MODEL).returning(cls._MODEL, sort_by_parameter_order=True),
+                    [cls._get_model_data(data_dict) for data_dict in data_list],
+                )
+            )
+            await commit_session(session)
+            await cls._after_create_many(entities, data_list)
+            result.extend(entities)
+
+        return result
+
+    @classmethod
+    @add_session_db
+    async def update_many(
+        cls,
+        data: Iterable[PydanticBaseModel],
+        chunk_size: int | None = None,
+        session: AsyncSession = None,  # type: ignore[call-arg]
+    ) -> None:
+        """
+        Массовое обновление сущностей по первичному ключу.
+        Обновление выполняется одним UPDATE в режиме executemany на пачку, без предварительного чтения записей.
+        Если в сервисе переопределены _before_update или _after_update, сущности обновляются по одной через update,
+        чтобы хуки не пропускались
+
+        Args:
+            data (Iterable[PydanticBaseModel]): Данные о сущностях. Каждая запись должна содержать первичный ключ
+            chunk_size (int | None): Размер пачки. По-умолчанию - _BULK_CHUNK_SIZE
+            session (AsyncSession): Сессия подключения к БД
+
+        Raises:
+            UpdateAllowedById: В одной из записей нет первичного ключа
+
+        Examples:
+            >>> await UserService.update_many([UserUpdate(id=1, name="Иван"), UserUpdate(id=2, name="Петр")])
+        """
+        has_updated_at: bool = hasattr(cls._MODEL, "updated_at")
+        per_entity: bool = cls._is_overridden("_before_update", "_after_update")
+
+        for chunk in cls._chunked(data, chunk_size):
+            data_list: List[dict] = [item.model_dump() for item in chunk]
+
+            if any(data_dict.get(cls._PRIMARY_KEY) is None for data_dict in data_list):
+                raise UpdateAllowedById()
+
+            if per_entity:
+                for item in chunk:
+                    await cls.update(item)
+
+                continue
+
+            await cls._before_update_many(data_list)
+
+            update_list: List[dict] = [cls._get_model_data(data_dict) for data_dict in data_list]
+
+            if has_updated_at:
+                now: datetime = datetime.now()
+
+                for update_data in update_list:
+                    update_data["updated_at"] = now
+
+            await session.execute(update(cls._MODEL), update_list)
+            await commit_session(session)
+            await cls._invalidate_cache(*(data_dict[cls._PRIMARY_KEY] for data_dict in data_list))
+            await cls._after_update_many(data_list)
+
+    @classmethod
+    @add_session_db
+    async def delete_many(
+        cls,
+        entity_ids: Iterable[int],
+        force_delete: bool = False,
+        chunk_size: int | None = None,
+        session: AsyncSession = None,  # type: ignore[call-arg]
+    ) -> int:
+        """
+        Массовое удаление сущностей по идентификаторам.
+        Для моделей с мягким удалением записи помечаются на удаление, уже помеченные - удаляются физически.
+        Если в сервисе переопределены _before_delete или _after_delete, сущности удаляются по одной через delete,
+        чтобы хуки не пропускались. Отсутствующие записи пропускаются
+
+        Args:
+            entity_ids (Iterable[int]): Идентификаторы сущностей
+            force_delete (bool): Удалить записи физически
+            chunk_size (int | None): Размер пачки. По-умолчанию - _BULK_CHUNK_SIZE
+            session (AsyncSession): Сессия подключения к БД
+
+        Returns:
+            (int): Количество затронутых записей
+
+        Examples:
+            >>> await UserService.delete_many([1, 2, 3])
+        """
+        primary_key = getattr(cls._MODEL, cls._PRIMARY_KEY)
+        soft_delete: bool = hasattr(cls._MODEL, "deleted_at") and not force_delete
+        affected: int = 0
+
+        if cls._is_overridden("_before_delete", "_after_delete"):
+            for entity_id in entity_ids:
+                try:
+                    await cls.delete(entity_id, force_delete)
+                except EntityNotFound:
+                    continue
+
+                affected += 1
+
+            return affected
+
+        for chunk in cls._chunked(entity_ids, chunk_size):
+            ids: List[int] = list(chunk)
+            await cls._before_delete_many(ids, force_delete)
+
+            if soft_delete:
+                # Сначала физически удаляем уже помеченные записи, затем помечаем остальные
+                force_result = await session.execute(
+                    delete(cls._MODEL)
+                    .where(primary_key.in_(ids), cls._MODEL.deleted_at.is_not(None))
+                    .execution_options(synchronize_session=False)
+                )
+                soft_result = await session.execute(
+                    update(cls._MODEL)
+                    .where(primary_key.in_(ids), cls._MODEL.deleted_at.is_(None))
+                    .values(deleted_at=datetime.now())
+                    .execution_options(synchronize_session=False)
+                )
+                affected += soft_result.rowcount + force_result.rowcount
+            else:
+                force_result = await session.execute(
+                    delete(cls._MODEL).where(primary_key.in_(ids)).execution_options(synchronize_session=False)
+                )
+                affected += force_result.rowcount
+
+            await commit_session(session)
+            await cls._invalidate_cache(*ids)
+            await cls._after_delete_many(ids, force_delete)
+
+        return affected
+
+    @classmethod
+    @add_session_db(readonly=True)
     async def list(
-            cls, filters: DictOrNone = None, navigation: DictOrNone = None, session: AsyncSession = None # type: ignore[call-arg]
+        cls,
+        filters: DictOrNone = None,
+        navigation: DictOrNone = None,
+        fields: Iterable[str] | None = None,
+        profile: str | None = None,
+        options: Iterable[ExecutableOption] | None = None,
+        session: AsyncSession = None,  # type: ignore[call-arg]
     ) -> List[M]:
         """
-        Запрос списка по сущности с фильтрацией и навигацией
+        Запрос списка по сущности с фильтрацией и навигацией.
+        При выборке полей возвращаются строки (Row) без создания моделей и их отслеживания сессией,
+        словари из них получаются через M.to_dicts
 
         Args:
             session (AsyncSession): Сессия подключения к БД
             filters (dict | None): Фильтр метода
             navigation (dict | None): Навигация метода
+            fields (Iterable[str] | None): Поля выборки. Имеют приоритет над профилем
+            profile (str | None): Профиль загрузки из _LOAD_PROFILES
+            options (Iterable[ExecutableOption] | None): Опции загрузки связей. Заменяют опции метода
+                из _LOADER_OPTIONS
 
         Returns:
             (List[M]): результаты запроса
@@ -158,22 +471,378 @@ class BaseService(Generic[M]):
             >>>
             >>> async def get_active_users(session: AsyncSession) -> List[UserModel]:
             ...     return UserService.list(session, {"is_active": True}, {"page": 0, "limit": 30})
+            >>>
+            >>> rows = await UserService.list({"is_active": True}, fields=("id", "name"))
+            >>> UserModel.to_dicts(rows)
+            >>>
+            >>> users = await UserService.list(options=[selectinload(UserModel.roles)])
         """
-        query: Select = select(cls._MODEL)
+        nav: Navigation = parse_navigation(navigation, cls._MAX_LIMIT)
+        loader_options: tuple[ExecutableOption, ...] = cls._get_loader_options("list", fields, options)
+        query: Select = cls._get_select(fields, profile, loader_options)
         query = await cls._before_list(query, filters, navigation)
-        query_result: Result[tuple[M]] = await session.execute(query)
-        result: List[M] = list(query_result.scalars().all())
+        query = apply_navigation(query, cls._MODEL, cls._PRIMARY_KEY, nav)
+        query_result: Result = await session.execute(query)
+        result: List[M] = cls._fetch_all(query_result, fields, bool(loader_options))
         await cls._after_list(result, filters, navigation)
 
         return result
 
     @classmethod
-    @add_session_db
-    async def get_one_by_filter(cls, session: AsyncSession, **filters) -> M | None:
-        query: Select = select(cls._MODEL).filter_by(**filters)
-        data: Result[tuple[M]] = await session.execute(query)
+    @add_session_db(readonly=True)
+    async def list_page(
+        cls,
+        filters: DictOrNone = None,
+        navigation: DictOrNone = None,
+        fields: Iterable[str] | None = None,
+        profile: str | None = None,
+        options: Iterable[ExecutableOption] | None = None,
+        session: AsyncSession = None,  # type: ignore[call-arg]
+    ) -> Page[M]:
+        """
+        Запрос страницы списка с признаком наличия следующей страницы и курсором.
+        Общее количество записей считается отдельным запросом только при navigation["total"].
+        При навигации по ключу к полям выборки добавляются поля сортировки
+
+        Args:
+            filters (dict | None): Фильтр метода
+            navigation (dict | None): Навигация метода. Описание параметров - в Navigation
+            fields (Iterable[str] | None): Поля выборки. Вместо моделей возвращаются строки (Row)
+            profile (str | None): Профиль загрузки из _LOAD_PROFILES
+            options (Iterable[ExecutableOption] | None): Опции загрузки связей. Заменяют опции метода
+                из _LOADER_OPTIONS
+            session (AsyncSession): Сессия подключения к БД
+
+        Returns:
+            (Page[M]): Страница результатов
+
+        Examples:
+            >>> page = await UserService.list_page(navigation={"limit": 30, "cursor": None, "order_by": "created_at"})
+            >>> next_page = await UserService.list_page(
+            ...     navigation={"limit": 30, "cursor": page.next_cursor, "order_by": "created_at"}
+            ... )
+        """
+        nav: Navigation = parse_navigation(navigation, cls._MAX_LIMIT)
+
+        if fields is not None and nav.is_keyset:
+            # Курсор следующей страницы строится по значениям полей сортировки последней записи
+            order_columns = get_order_columns(cls._MODEL, cls._PRIMARY_KEY, nav.order_by, keyset=True)
+            fields = (*normalize_fields(fields), *(column.key for column in order_columns))
+
+        loader_options: tuple[ExecutableOption, ...] = cls._get_loader_options("list", fields, options)
+        query: Select = cls._get_select(fields, profile, loader_options)
+        query = await cls._before_list(query, filters, navigation)
+        total: int | None = await session.scalar(get_count_query(query)) if nav.total else None
+
+        query = apply_navigation(query, cls._MODEL, cls._PRIMARY_KEY, nav, extra_rows=1)
+        query_result: Result = await session.execute(query)
+        items: List[M] = cls._fetch_all(query_result, fields, bool(loader_options))
+        page: Page[M] = make_page(items, cls._MODEL, cls._PRIMARY_KEY, nav, total)
+        await cls._after_list(page.items, filters, navigation)
+
+        return page
+
+    @classmethod
+    async def stream(
+        cls,
+        filters: DictOrNone = None,
+        batch_size: int | None = None,
+        as_rows: bool = False,
+        chunked: bool = False,
+        use_primary: bool = False,
+        fields: Iterable[str] | None = None,
+        options: Iterable[ExecutableOption] | None = None,
+    ) -> AsyncIterator[Any]:
+        """
+        Потоковое чтение списка по серверному курсору без загрузки всего результата в память.
+        Сессия держится открытой, пока не исчерпан или не закрыт генератор
+
+        Args:
+            filters (dict | None): Фильтр метода
+            batch_size (int | None): Количество записей, забираемых с сервера за раз. По-умолчанию - _STREAM_BATCH_SIZE
+            as_rows (bool): Возвращать кортежи значений колонок вместо моделей
+            chunked (bool): Возвращать записи пачками по batch_size вместо одной записи
+            use_primary (bool): Читать с основного сервера, а не с реплики
+            fields (Iterable[str] | None): Поля выборки. Возвращаются кортежи значений только этих колонок
+            options (Iterable[ExecutableOption] | None): Опции загрузки связей. Заменяют опции метода
+                из _LOADER_OPTIONS. Совместимы с потоковым чтением только selectinload и raiseload
+
+        Returns:
+            (AsyncIterator[Any]): Модели, кортежи или их пачки
+
+        Warnings:
+            При досрочном выходе из цикла генератор нужно закрыть явно, иначе соединение вернется в пул
+            только при сборке мусора
+
+        Examples:
+            >>> from contextlib import aclosing
+            >>>
+            >>> async with aclosing(UserService.stream({"is_active": True}, batch_size=5000)) as users:
+            ...     async for user in users:
+            ...         ...
+        """
+        size: int = batch_size or cls._STREAM_BATCH_SIZE
+        if fields is not None:
+            query: Select = cls._get_select(fields)
+        elif as_rows:
+            query = select(*cls._MODEL.__table__.columns)
+        else:
+            query = cls._get_select(options=cls._get_loader_options("stream", fields, options))
+
+        query = await cls._before_list(query, filters, None)
+
+        async with session_scope(share=False, readonly=not use_primary) as session:
+            result = await session.stream(query.execution_options(yield_per=size))
+
+            if not as_rows and fields is None:
+                result = result.scalars()
+
+            async for partition in result.partitions(size):
+                if chunked:
+                    yield partition
+                else:
+                    for item in partition:
+                        yield item
+
+    @classmethod
+    @add_session_db(readonly=True)
+    async def get_one_by_filter(
+        cls,
+        session: AsyncSession,
+        *,
+        _fields: Iterable[str] | None = None,
+        _profile: str | None = None,
+        _options: Iterable[ExecutableOption] | None = None,
+        **filters,
+    ) -> M | None:
+        """
+        Получение одной сущности по фильтру.
+        Параметры выборки начинаются с подчеркивания, чтобы не пересекаться с полями фильтра
+
+        Args:
+            session (AsyncSession): Сессия подключения к БД
+            _fields (Iterable[str] | None): Поля выборки. Вместо модели возвращается строка (Row)
+            _profile (str | None): Профиль загрузки из _LOAD_PROFILES
+            _options (Iterable[ExecutableOption] | None): Опции загрузки связей. Заменяют опции метода
+                из _LOADER_OPTIONS
+            filters: Фильтр. Поддерживает операторы, см. dh_platform.filters
+
+        Returns:
+            (M | None): Данные модели или None, если запись не найдена
+
+        Examples:
+            >>> await UserService.get_one_by_filter(email="ivan@mail.ru", _fields=("id", "name"))
+        """
+        loader_options: tuple[ExecutableOption, ...] = cls._get_loader_options("read", _fields, _options)
+        query: Select = cls._apply_filters(cls._get_select(_fields, _profile, loader_options), filters)
+        data: Result = await session.execute(query)
+
+        if _fields is not None:
+            return data.one_or_none()
+
+        return (data.unique() if loader_options else data).scalar_one_or_none()
+
+    @classmethod
+    @add_session_db(readonly=True)
+    async def count(
+        cls,
+        filters: DictOrNone = None,
+        approximate: bool = False,
+        session: AsyncSession = None,  # type: ignore[call-arg]
+    ) -> int:
+        """
+        Количество записей по фильтру одним запросом SELECT count(*)
+
+        Args:
+            filters (dict | None): Фильтр метода
+            approximate (bool): Вернуть оценку количества всех записей таблицы из статистики PostgreSQL
+                (pg_class.reltuples) без чтения таблицы. Используется для больших таблиц, например, в админке.
+                При переданном фильтре, на других СУБД и для таблиц без собранной статистики считается точно
+            session (AsyncSession): Сессия подключения к БД
+
+        Returns:
+            (int): Количество записей
+
+        Warnings:
+            Оценка учитывает все строки таблицы, включая помеченные на удаление и отсекаемые в _before_list
+
+        Examples:
+            >>> await UserService.count({"is_active": True})
+            >>> await UserService.count(approximate=True)
+        """
+        if approximate and not filters:
+            estimate: int | None = await cls._get_estimated_count(session)
+
+            if estimate is not None:
+                return estimate
+
+        query: Select = select(func.count()).select_from(cls._MODEL)
+        query = await cls._before_list(query, filters, None)
+
+        return await session.scalar(query)
+
+    @classmethod
+    @add_session_db(readonly=True)
+    async def exists(cls, filters: DictOrNone = None, session: AsyncSession = None) -> bool:  # type: ignore[call-arg]
+        """
+        Проверка наличия записей по фильтру одним запросом SELECT EXISTS(...)
+
+        Args:
+            filters (dict | None): Фильтр метода
+            session (AsyncSession): Сессия подключения к БД
+
+        Returns:
+            (bool): Есть ли записи
+
+        Examples:
+            >>> await UserService.exists({"email": "ivan@mail.ru"})
+        """
+        query: Select = select(literal(1)).select_from(cls._MODEL)
+        query = await cls._before_list(query, filters, None)
+
+        return bool(await session.scalar(select(query.exists())))
+
+    @classmethod
+    @add_session_db(readonly=True)
+    async def aggregate(
+        cls,
+        filters: DictOrNone = None,
+        group_by: Iterable[str] | None = None,
+        sum_of: Iterable[str] = (),
+        min_of: Iterable[str] = (),
+        max_of: Iterable[str] = (),
+        avg_of: Iterable[str] = (),
+        session: AsyncSession = None,  # type: ignore[call-arg]
+    ) -> List[dict[str, Any]]:
+        """
+        Агрегаты по фильтру с группировкой одним запросом SELECT ... GROUP BY.
+        Для каждой группы возвращаются значения полей группировки, количество записей (count)
+        и агрегаты с ключами вида sum_<поле>, min_<поле>, max_<поле>, avg_<поле>
+
+        Args:
+            filters (dict | None): Фильтр метода
+            group_by (Iterable[str] | None): Поля группировки. Без группировки возвращается одна строка
+            sum_of (Iterable[str]): Поля для суммы
+            min_of (Iterable[str]): Поля для минимума
+            max_of (Iterable[str]): Поля для максимума
+            avg_of (Iterable[str]): Поля для среднего
+            session (AsyncSession): Сессия подключения к БД
+
+        Returns:
+            (List[dict[str, Any]]): Строки агрегатов, упорядоченные по полям группировки
+
+        Raises:
+            InvalidFields: Поля отсутствуют в модели
 
-        return data.scalar_one_or_none()
+        Examples:
+            >>> await OrderService.aggregate(
+            ...     {"status": "paid"}, group_by=["user_id"], sum_of=["amount"], max_of=["created_at"]
+            ... )
+            [{"user_id": 1, "count": 3, "sum_amount": 1500, "max_created_at": datetime(...)}, ...]
+        """
+        group_columns: tuple = get_columns(cls._MODEL, normalize_fields(group_by)) if group_by is not None else ()
+        columns: list = [*group_columns, func.count().label("count")]
+
+        for name, function, aggregated in (
+            ("sum", func.sum, sum_of),
+            ("min", func.min, min_of),
+            ("max", func.max, max_of),
+            ("avg", func.avg, avg_of),
+        ):
+            fields: tuple[str, ...] = normalize_fields(aggregated)
+
+            if fields:
+                columns.extend(
+                    function(column).label(f"{name}_{field}")
+                    for field, column in zip(fields, get_columns(cls._MODEL, fields))
+                )
+
+        query: Select = select(*columns).select_from(cls._MODEL)
+        query = await cls._before_list(query, filters, None)
+
+        if group_columns:
+            query = query.group_by(*group_columns).order_by(*group_columns)
+
+        return cls._MODEL.to_dicts((await session.execute(query)).all())
+
+    @classmethod
+    def _get_select(
+        cls,
+        fields: Iterable[str] | None = None,
+        profile: str | None = None,
+        options: tuple[ExecutableOption, ...] = (),
+    ) -> Select:
+        """
+        Построение запроса чтения сущностей.
+        При выборке полей запрашиваются только их колонки, иначе - модели с опциями профиля и опциями загрузки связей
+
+        Args:
+            fields (Iterable[str] | None): Поля выборки
+            profile (str | None): Профиль загрузки из _LOAD_PROFILES
+            options (tuple[ExecutableOption, ...]): Опции загрузки связей
+
+        Returns:
+            (Select): Запрос
+
+        Raises:
+            InvalidFields: Поля отсутствуют в модели или профиль не найден
+        """
+        if fields is not None:
+            return select(*get_columns(cls._MODEL, normalize_fields(fields)))
+
+        query: Select = select(cls._MODEL)
+
+        if profile is not None:
+            load_profile: LoadProfile | None = cls._LOAD_PROFILES.get(profile)
+
+            if load_profile is None:
+                raise InvalidFields(detail=f"Профиль загрузки {profile} не найден")
+
+            query = query.options(*get_load_options(cls._MODEL, load_profile))
+
+        return query.options(*options) if options else query
+
+    @classmethod
+    def _get_loader_options(
+        cls, method: str, fields: Iterable[str] | None, options: Iterable[ExecutableOption] | None
+    ) -> tuple[ExecutableOption, ...]:
+        """
+        Получение опций загрузки связей метода: опции вызова или, если они не переданы, опции из _LOADER_OPTIONS.
+        Опции не объединяются, так как SQLAlchemy не допускает разных стратегий загрузки одной связи
+
+        Args:
+            method (str): Ключ метода в _LOADER_OPTIONS
+            fields (Iterable[str] | None): Поля выборки. При выборке полей связи не загружаются
+            options (Iterable[ExecutableOption] | None): Опции вызова
+
+        Returns:
+            (tuple[ExecutableOption, ...]): Опции загрузки
+        """
+        if fields is not None:
+            return ()
+
+        if options is not None:
+            return tuple(options)
+
+        return tuple(cls._LOADER_OPTIONS.get(method, cls._LOADER_OPTIONS.get("default", ())))
+
+    @classmethod
+    def _fetch_all(cls, result: Result, fields: Iterable[str] | None, unique: bool = False) -> List[Any]:
+        """
+        Получение записей результата: строк при выборке полей, иначе моделей
+
+        Args:
+            result (Result): Результат запроса
+            fields (Iterable[str] | None): Поля выборки
+            unique (bool): Убрать повторы моделей. Нужно при загрузке коллекций через joinedload
+
+        Returns:
+            (List[Any]): Записи
+        """
+        if fields is not None:
+            return list(result.all())
+
+        return list((result.unique() if unique else result).scalars().all())
 
     @classmethod
     def _get_new_entity(cls, data_dict: dict) -> M:
@@ -197,13 +866,245 @@ class BaseService(Generic[M]):
         return new_entity
 
     @classmethod
-    async def _before_list(cls, query: Select, filters: DictOrNone, navigation: DictOrNone) -> None:
-        if filters:
-            for key, value in filters.items():
-                if hasattr(cls._MODEL, key):
-                    query = query.where(key == value)
+    def _can_update_fast(cls, fast: bool | None) -> bool:
+        """
+        Можно ли обновить запись одним запросом без чтения.
+        Хук _before_update требует прежних данных записи, поэтому при его переопределении используется обычный путь
+
+        Args:
+            fast (bool | None): Запрошен быстрый режим. None - по-умолчанию сервиса
+
+        Returns:
+            (bool): Можно ли использовать быстрый режим
+        """
+        if not (cls._FAST_UPDATE if fast is None else fast):
+            return False
+
+        return not cls._is_overridden("_before_update")
+
+    @classmethod
+    def _is_overridden(cls, *hooks: str) -> bool:
+        """
+        Переопределен ли в сервисе хотя бы один из хуков.
+        Массовые методы не вызывают хуки отдельных сущностей, поэтому при их переопределении обрабатывают
+        сущности по одной
+
+        Args:
+            hooks (str): Названия хуков
+
+        Returns:
+            (bool): Хотя бы один хук переопределен
+        """
+        return any(
+            getattr(cls, hook).__func__ is not getattr(BaseService, hook).__func__  # type: ignore[attr-defined]
+            for hook in hooks
+        )
+
+    @classmethod
+    async def _update_fast(cls, new_data: PydanticBaseModel, session: AsyncSession) -> M:
+        """
+        Обновление записи одним UPDATE ... WHERE pk = :id RETURNING *. Обновляются только переданные поля.
+        Если задан _VERSION_COLUMN, переданная версия проверяется в условии запроса и увеличивается
+
+        Args:
+            new_data (PydanticBaseModel): Данные сущности с первичным ключом
+            session (AsyncSession): Сессия подключения к БД
+
+        Returns:
+            (M): Данные модели
+        """
+        data_dict: dict = new_data.model_dump(exclude_unset=True)
+        entity_id: Any = data_dict.get(cls._PRIMARY_KEY)
+
+        if entity_id is None:
+            raise UpdateAllowedById()
+
+        values: dict = cls._get_model_data(data_dict)
+        values.pop(cls._PRIMARY_KEY)
+        query = update(cls._MODEL).where(getattr(cls._MODEL, cls._PRIMARY_KEY) == entity_id)
+
+        if cls._VERSION_COLUMN is not None:
+            version_column = getattr(cls._MODEL, cls._VERSION_COLUMN)
+            version: int | None = values.pop(cls._VERSION_COLUMN, None)
+
+            if version is not None:
+                query = query.where(version_column == version)
+
+            values[cls._VERSION_COLUMN] = version_column + 1
+
+        if hasattr(cls._MODEL, "updated_at"):
+            values["updated_at"] = datetime.now()
+
+        if not values:
+            return await cls.read(entity_id=entity_id)
+
+        entity: M | None = (await session.scalars(query.values(**values).returning(cls._MODEL))).one_or_none()
+
+        if entity is None:
+            if await cls.get_one_by_filter(**{cls._PRIMARY_KEY: entity_id}) is None:
+                raise EntityNotFound()
+
+            raise EntityVersionConflict()
+
+        await commit_session(session)
+        await cls._invalidate_cache(entity_id)
+        await cls._after_update(entity)
+
+        return entity
+
+    @classmethod
+    def _check_version(cls, old_data: M, data_dict: dict) -> int | None:
+        """
+        Проверка версии записи при обновлении
+
+        Args:
+            old_data (M): Текущие данные записи
+            data_dict (dict): Новые данные
+
+        Returns:
+            (int | None): Текущая версия записи или None, если версионирование не используется
+
+        Raises:
+            EntityVersionConflict: Переданная версия не совпадает с текущей
+        """
+        if cls._VERSION_COLUMN is None:
+            return None
+
+        version: int = getattr(old_data, cls._VERSION_COLUMN)
+        new_version: int | None = data_dict.pop(cls._VERSION_COLUMN, None)
+
+        if new_version is not None and new_version != version:
+            raise EntityVersionConflict()
+
+        return version
+
+    @classmethod
+    def _get_cache_key(cls, entity_id: Any) -> tuple:
+        """
+        Ключ сущности в кэше
+
+        Args:
+            entity_id (Any): Идентификатор сущности
+
+        Returns:
+            (tuple): Ключ
+        """
+        return cls._MODEL.__name__, entity_id
+
+    @classmethod
+    async def _invalidate_cache(cls, *entity_ids: Any) -> None:
+        """
+        Удаление сущностей из кэша после изменения.
+        Внутри unit_of_work удаление выполняется после фиксации его транзакции, иначе параллельное чтение
+        может закэшировать прежние данные на все время жизни записи
+
+        Args:
+            entity_ids (Any): Идентификаторы сущностей
+        """
+        if cls._CACHE is None:
+            return
+
+        cache: EntityCache = cls._CACHE
+        keys: list[tuple] = [cls._get_cache_key(entity_id) for entity_id in entity_ids]
+
+        await on_commit(lambda: cache.invalidate(*keys))
+
+    @classmethod
+    def _get_model_data(cls, data_dict: dict) -> dict:
+        """
+        Получение из данных только тех полей, что являются колонками модели
+
+        Args:
+            data_dict (dict): Данные сущности
+
+        Returns:
+            (dict): Данные для записи в таблицу
+        """
+        columns = inspect(cls._MODEL).column_attrs
+
+        return {key: value for key, value in data_dict.items() if key in columns}
+
+    @classmethod
+    def _chunked(cls, data: Iterable, chunk_size: int | None = None) -> Iterator[tuple]:
+        """
+        Разбиение данных на пачки для массовых операций
+
+        Args:
+            data (Iterable): Данные
+            chunk_size (int | None): Размер пачки. По-умолчанию - _BULK_CHUNK_SIZE
+
+        Returns:
+            (Iterator[tuple]): Пачки данных
+        """
+        size: int = chunk_size or cls._BULK_CHUNK_SIZE
+        iterator = iter(data)
+
+        while chunk := tuple(islice(iterator, size)):
+            yield chunk
+
+    @classmethod
+    async def _before_list(cls, query: Select, filters: DictOrNone, navigation: DictOrNone) -> Select:
+        return cls._apply_filters(cls._exclude_deleted(query, filters), filters)
+
+    @classmethod
+    def _exclude_deleted(cls, query: Select, filters: DictOrNone) -> Select:
+        """
+        Исключение помеченных на удаление записей из списков, если у сервиса включен _EXCLUDE_DELETED.
+        Если в фильтре есть условие по deleted_at, условие фильтра имеет приоритет
+
+        Args:
+            query (Select): Запрос
+            filters (dict | None): Фильтр
+
+        Returns:
+            (Select): Запрос
+        """
+        if not cls._EXCLUDE_DELETED or not hasattr(cls._MODEL, "deleted_at"):
+            return query
+
+        if filters and any(key.partition(SEPARATOR)[0] == "deleted_at" for key in filters):
+            return query
+
+        return query.where(cls._MODEL.deleted_at.is_(None))
+
+    @classmethod
+    async def _get_estimated_count(cls, session: AsyncSession) -> int | None:
+        """
+        Оценка количества строк таблицы по статистике планировщика PostgreSQL
+
+        Args:
+            session (AsyncSession): Сессия подключения к БД
+
+        Returns:
+            (int | None): Оценка или None, если СУБД не PostgreSQL или статистика не собрана
+        """
+        if session.get_bind().dialect.name != "postgresql":
+            return None
+
+        estimate: int | None = await session.scalar(
+            text("SELECT reltuples::bigint FROM pg_class WHERE oid = to_regclass(:name)"),
+            {"name": cls._MODEL.__table__.fullname},
+        )
+
+        # До первого ANALYZE reltuples равен -1 (PostgreSQL 14+) или 0
+        return estimate if estimate is not None and estimate > 0 else None
+
+    @classmethod
+    def _apply_filters(cls, query: Select, filters: DictOrNone) -> Select:
+        """
+        Применение фильтра к запросу. Ключи фильтра проверяются по колонкам модели
 
-        return query
+        Args:
+            query (Select): Запрос
+            filters (dict | None): Фильтр вида {"name": "Иван", "age__gte": 18, "id__in": [1, 2]}
+
+        Returns:
+            (Select): Запрос с условиями фильтра
+
+        Raises:
+            InvalidFilter: Поле отсутствует в модели или оператор не поддерживается
+        """
+        return get_filter_compiler(cls._MODEL).apply(query, filters)
 
     @classmethod
     async def _after_list(cls, result: List[M], filters: DictOrNone, navigation: DictOrNone) -> None: ...
@@ -215,21 +1116,38 @@ class BaseService(Generic[M]):
     async def _after_create(cls, entity_data: M, create_data: dict) -> None: ...
 
     @classmethod
-    async def _after_read(cls, entity_data: M) -> None:
-        ...
+    async def _before_create_many(cls, create_data: List[dict]) -> None:
+        for data_dict in create_data:
+            await cls._before_create(data_dict)
+
+    @classmethod
+    async def _after_create_many(cls, entities: List[M], create_data: List[dict]) -> None:
+        for entity_data, data_dict in zip(entities, create_data):
+            await cls._after_create(entity_data, data_dict)
+
+    @classmethod
+    async def _after_read(cls, entity_data: M) -> None: ...
+
+    @classmethod
+    async def _before_update(cls, data_dict: dict, old_data: M) -> None: ...
+
+    @classmethod
+    async def _after_update(cls, old_data: M) -> None: ...
+
+    @classmethod
+    async def _before_update_many(cls, data_list: List[dict]) -> None: ...
+
+    @classmethod
+    async def _after_update_many(cls, data_list: List[dict]) -> None: ...
 
     @classmethod
-    async def _before_update(cls, data_dict: dict, old_data: M) -> None:
-        ...
+    async def _before_delete(cls, entity_data: M, force_delete: bool) -> None: ...
 
     @classmethod
-    async def _after_update(cls, old_data: M) -> None:
-        ...
+    async def _after_delete(cls, entity_data: M) -> None: ...
 
     @classmethod
-    async def _before_delete(cls, entity_data: M, force_delete: bool) -> None:
-        ...
+    async def _before_delete_many(cls, entity_ids: List[int], force_delete: bool) -> None: ...
 
     @classmethod
-    async def _after_delete(cls, entity_data: M) -> None:
-        ...
+    async def _after_delete_many(cls, entity_ids: List[int], force_delete: bool) -> None: ...
@@ -3,8 +3,10 @@
 __author__: str = "Старков Е.П."
 
 from functools import lru_cache
+from typing import Literal
 
 from pydantic_settings import BaseSettings
+from sqlalchemy.pool import NullPool
 
 
 class DatabaseSettings(BaseSettings):
@@ -18,6 +20,20 @@ class DatabaseSettings(BaseSettings):
         PASSWORD (str): Пароль БД
         NAME (str): Название БД
         DRIVER (str): Драйвер БД
+        POOL_SIZE (int): Количество постоянных соединений в пуле
+        MAX_OVERFLOW (int): Количество дополнительных соединений сверх POOL_SIZE
+        POOL_TIMEOUT (float): Время ожидания свободного соединения, секунды
+        POOL_RECYCLE (int): Время жизни соединения, секунды. -1 - без ограничения
+        POOL_PRE_PING (bool): Проверять соединение перед каждой выдачей из пула
+        POOL_PING_IDLE_SECONDS (float | None): Проверять соединение, только если оно простаивало дольше указанного
+            времени. Заменяет POOL_PRE_PING
+        USE_NULL_POOL (bool): Не держать пул соединений. Используется при работе через PgBouncer
+        STATEMENT_CACHE_SIZE (int): Размер кэша подготовленных выражений asyncpg. Для PgBouncer в режиме
+            транзакций должен быть 0
+        STATEMENT_TIMEOUT (int | None): Серверный statement_timeout, миллисекунды
+        ENGINE_PER_LOOP (bool): Создавать отдельный движок на каждый цикл событий
+        REPLICA_DSNS (list[str]): DSN реплик для чтения. Каждая реплика получает свой пул с теми же настройками
+        REPLICA_STRATEGY (str): Стратегия выбора реплики: round_robin или least_connections
     Warnings:
         Данные переменные должны быть описаны в файле .env
     """
@@ -28,6 +44,18 @@ class DatabaseSettings(BaseSettings):
     PASSWORD: str
     NAME: str
     DRIVER: str = "postgresql+asyncpg"
+    POOL_SIZE: int = 5
+    MAX_OVERFLOW: int = 10
+    POOL_TIMEOUT: float = 30
+    POOL_RECYCLE: int = -1
+    POOL_PRE_PING: bool = True
+    POOL_PING_IDLE_SECONDS: float | None = None
+    USE_NULL_POOL: bool = False
+    STATEMENT_CACHE_SIZE: int = 100
+    STATEMENT_TIMEOUT: int | None = None
+    ENGINE_PER_LOOP: bool = False
+    REPLICA_DSNS: list[str] = []
+    REPLICA_STRATEGY: Literal["round_robin", "least_connections"] = "round_robin"
 
     class Config:
         """Класс конфигурации настроек"""
@@ -41,6 +69,34 @@ class DatabaseSettings(BaseSettings):
         """Формирует DSN (Data Source Name) для подключения."""
         return f"{self.DRIVER}://" f"{self.USER}:{self.PASSWORD}" f"@{self.HOST}:{self.PORT}" f"/{self.NAME}"
 
+    @property
+    def engine_options(self) -> dict:
+        """Формирует параметры движка SQLAlchemy: настройки пула и подключения драйвера."""
+        options: dict = {"pool_pre_ping": self.POOL_PRE_PING and self.POOL_PING_IDLE_SECONDS is None}
+
+        if self.USE_NULL_POOL:
+            options["poolclass"] = NullPool
+        else:
+            options.update(
+                pool_size=self.POOL_SIZE,
+                max_overflow=self.MAX_OVERFLOW,
+                pool_timeout=self.POOL_TIMEOUT,
+                pool_recycle=self.POOL_RECYCLE,
+            )
+
+        if "asyncpg" in self.DRIVER:
+            connect_args: dict = {
+                "statement_cache_size": self.STATEMENT_CACHE_SIZE,
+                "prepared_statement_cache_size": self.STATEMENT_CACHE_SIZE,
+            }
+
+            if self.STATEMENT_TIMEOUT is not None:
+                connect_args["server_settings"] = {"statement_timeout": str(self.STATEMENT_TIMEOUT)}
+
+            options["connect_args"] = connect_args
+
+        return options
+
 
 @lru_cache
 def get_db_settings() -> DatabaseSettings:
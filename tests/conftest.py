@@ -0,0 +1,148 @@
+"""Общие фикстуры тестов"""
+
+__author__: str = "Старков Е.П."
+
+import logging
+from typing import Any, AsyncIterator, Iterator
+
+import pytest
+from pydantic import BaseModel as PydanticBaseModel
+from sqlalchemy import String
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlalchemy.orm import Mapped, mapped_column
+
+from dh_platform.databases import DEFAULT_ENGINE, registry
+from dh_platform.models import BaseModel, IDMixin, SoftDeleteMixin
+from dh_platform.services import BaseService
+
+
+class UserModel(BaseModel, IDMixin, SoftDeleteMixin):
+    name: Mapped[str] = mapped_column(String, index=True)
+    age: Mapped[int | None] = mapped_column(nullable=True)
+    email: Mapped[str | None] = mapped_column(String, index=True, nullable=True)
+    profile: Mapped[str | None] = mapped_column(String, nullable=True)
+
+
+class AuditModel(BaseModel, IDMixin):
+    action: Mapped[str] = mapped_column(String)
+
+
+class DocumentModel(BaseModel, IDMixin):
+    title: Mapped[str] = mapped_column(String)
+    version: Mapped[int] = mapped_column(default=1)
+
+
+class UserCreate(PydanticBaseModel):
+    name: str
+    age: int | None = None
+    profile: str | None = None
+
+
+class UserUpdate(PydanticBaseModel):
+    id: int
+    name: str
+    age: int | None = None
+
+
+class AuditCreate(PydanticBaseModel):
+    action: str
+
+
+class DocumentCreate(PydanticBaseModel):
+    title: str
+
+
+class DocumentUpdate(PydanticBaseModel):
+    id: int
+    title: str | None = None
+    version: int | None = None
+
+
+class UserService(BaseService[UserModel]):
+    _MODEL = UserModel
+
+
+class AuditService(BaseService[AuditModel]):
+    _MODEL = AuditModel
+
+
+class DocumentService(BaseService[DocumentModel]):
+    _MODEL = DocumentModel
+    _FAST_UPDATE = True
+    _VERSION_COLUMN = "version"
+
+
+@pytest.fixture
+def anyio_backend() -> str:
+    return "asyncio"
+
+
+class CollectingHandler(logging.Handler):
+    def __init__(self) -> None:
+        super().__init__()
+        self.records: list[logging.LogRecord] = []
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.records.append(record)
+
+
+@pytest.fixture
+def log_records() -> Iterator[list[logging.LogRecord]]:
+    """Записи логгера dh_logger, созданные в тесте"""
+    handler: CollectingHandler = CollectingHandler()
+    logger: logging.Logger = logging.getLogger("dh_logger")
+    level: int = logger.level
+    logger.addHandler(handler)
+    logger.setLevel(logging.DEBUG)
+
+    yield handler.records
+
+    logger.removeHandler(handler)
+    logger.setLevel(level)
+
+
+async def asgi_get(app: Any, path: str, headers: list[tuple[bytes, bytes]] | None = None) -> dict[str, Any]:
+    """Выполнение GET запроса к ASGI-приложению. Возвращает статус, заголовки и тело ответа"""
+    scope: dict[str, Any] = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "root_path": "",
+        "query_string": b"",
+        "headers": headers or [],
+        "client": ("127.0.0.1", 1234),
+        "server": ("testserver", 80),
+    }
+    response: dict[str, Any] = {"body": b""}
+
+    async def receive() -> dict[str, Any]:
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message: dict[str, Any]) -> None:
+        if message["type"] == "http.response.start":
+            response["status"] = message["status"]
+            response["headers"] = dict(message["headers"])
+        else:
+            response["body"] += message.get("body", b"")
+
+    await app(scope, receive, send)
+
+    return response
+
+
+@pytest.fixture
+async def engine(tmp_path) -> AsyncIterator[AsyncEngine]:
+    """Основной движок на файле SQLite. Для каждого теста - новая БД"""
+    test_engine: AsyncEngine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'test.db'}")
+    registry.register(DEFAULT_ENGINE, factory=lambda: test_engine)
+
+    async with registry.get_engine().begin() as connection:
+        await connection.run_sync(BaseModel.metadata.create_all)
+
+    yield registry.get_engine()
+
+    await registry.dispose()
@@ -0,0 +1,100 @@
+"""Тесты кэша сущностей"""
+
+__author__: str = "Старков Е.П."
+
+import asyncio
+
+import pytest
+
+from dh_platform.cache import MISSING, EntityCache
+from dh_platform.databases import unit_of_work
+from tests.conftest import UserCreate, UserService, UserUpdate
+
+pytestmark = pytest.mark.anyio
+
+
+class CachedUserService(UserService):
+    _CACHE = EntityCache(ttl=60)
+
+
+async def test_single_load_for_concurrent_misses():
+    cache: EntityCache = EntityCache()
+    calls: list[int] = []
+
+    async def loader() -> str:
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return "value"
+
+    results = await asyncio.gather(*(cache.get_or_load("key", loader) for _ in range(5)))
+
+    assert results == ["value"] * 5
+    assert len(calls) == 1
+
+
+async def test_waiter_survives_cancelled_loader():
+    cache: EntityCache = EntityCache()
+    started: asyncio.Event = asyncio.Event()
+    calls: list[int] = []
+
+    async def loader() -> str:
+        calls.append(1)
+        started.set()
+        await asyncio.sleep(0.05)
+        return "value"
+
+    first: asyncio.Task = asyncio.create_task(cache.get_or_load("key", loader))
+    await started.wait()
+    second: asyncio.Task = asyncio.create_task(cache.get_or_load("key", loader))
+    await asyncio.sleep(0)
+    first.cancel()
+
+    assert await second == "value"
+    assert first.cancelled()
+    assert len(calls) == 2
+
+
+async def test_invalidation_discards_inflight_load():
+    cache: EntityCache = EntityCache()
+    started: asyncio.Event = asyncio.Event()
+    release: asyncio.Event = asyncio.Event()
+
+    async def slow_loader() -> str:
+        started.set()
+        await release.wait()
+        return "old"
+
+    async def loader() -> str:
+        return "new"
+
+    load: asyncio.Task = asyncio.create_task(cache.get_or_load("key", slow_loader))
+    await started.wait()
+    await cache.invalidate("key")
+
+    # Новый вызов не ждет устаревшую загрузку
+    assert await asyncio.wait_for(cache.get_or_load("key", loader), 1) == "new"
+
+    release.set()
+
+    assert await load == "old"
+    assert await cache.backend.get("key") == "new"
+
+    load = asyncio.create_task(cache.get_or_load("other", slow_loader))
+    await asyncio.sleep(0)
+    await cache.invalidate("other")
+
+    assert await load == "old"
+    assert await cache.backend.get("other") is MISSING
+
+
+async def test_invalidation_waits_for_unit_of_work_commit(engine):
+    user = await CachedUserService.create(UserCreate(name="Иван"))
+    await CachedUserService.read(user.id)
+    key: tuple = CachedUserService._get_cache_key(user.id)
+
+    async with unit_of_work():
+        await CachedUserService.update(UserUpdate(id=user.id, name="Петр"))
+        assert await CachedUserService._CACHE.backend.get(key) is not MISSING
+
+    assert await CachedUserService._CACHE.backend.get(key) is MISSING
+    assert (await CachedUserService.read(user.id)).name == "Петр"
@@ -0,0 +1,47 @@
+"""Тесты сессий подключения к БД"""
+
+__author__: str = "Старков Е.П."
+
+import asyncio
+
+import pytest
+
+from dh_platform.databases import (
+    get_current_session,
+    session_scope,
+    unit_of_work,
+)
+from tests.conftest import AuditCreate, AuditService, UserCreate, UserService
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_child_task_does_not_share_session(engine):
+    async def get_child_session():
+        return get_current_session()
+
+    async with session_scope() as session:
+        assert get_current_session() is session
+        child_session = await asyncio.create_task(get_child_session())
+
+    assert child_session is None
+
+
+async def test_concurrent_calls_from_service_hook(engine):
+    class HookedUserService(UserService):
+        @classmethod
+        async def _after_create(cls, entity_data, create_data) -> None:
+            await asyncio.gather(*(AuditService.create(AuditCreate(action=f"create-{i}")) for i in range(4)))
+
+    await HookedUserService.create(UserCreate(name="Иван"))
+
+    assert len(await AuditService.list()) == 4
+
+
+async def test_unit_of_work_rolls_back(engine):
+    with pytest.raises(RuntimeError):
+        async with unit_of_work():
+            await UserService.create(UserCreate(name="Иван"))
+            raise RuntimeError()
+
+    assert await UserService.list() == []
@@ -0,0 +1,57 @@
+"""Тесты обработчиков исключений"""
+
+__author__: str = "Старков Е.П."
+
+from typing import Any
+
+import pytest
+from fastapi import FastAPI
+
+from dh_platform import exception_handlers
+from dh_platform.exception_handlers import (
+    ExceptionLogLimiter,
+    register_exception_handlers,
+)
+from dh_platform.exceptions import BaseAppException, EntityVersionConflict
+from tests.conftest import asgi_get
+
+pytestmark = pytest.mark.anyio
+
+
+class StorageUnavailable(BaseAppException):
+    _DETAIL = "Хранилище недоступно"
+
+
+def test_limiter_suppresses_repeats(monkeypatch):
+    now: list[float] = [0.0]
+    monkeypatch.setattr(exception_handlers.time, "monotonic", lambda: now[0])
+    limiter: ExceptionLogLimiter = ExceptionLogLimiter(window=60, limit=2)
+
+    assert [limiter.acquire("key") for _ in range(5)] == [0, 0, None, None, None]
+    assert limiter.acquire("other") == 0
+    assert limiter.suppressed == 3
+
+    now[0] = 60.0
+
+    assert limiter.acquire("key") == 3
+    assert limiter.acquire("key") == 0
+
+
+async def test_traceback_only_for_server_errors(log_records, monkeypatch):
+    monkeypatch.setattr(exception_handlers, "exception_log_limiter", ExceptionLogLimiter(limit=1))
+    app: FastAPI = FastAPI()
+    register_exception_handlers(app)
+
+    @app.get("/conflict")
+    async def conflict() -> Any:
+        raise EntityVersionConflict()
+
+    @app.get("/storage")
+    async def storage() -> Any:
+        raise StorageUnavailable()
+
+    assert (await asgi_get(app, "/conflict"))["status"] == 409
+    assert (await asgi_get(app, "/conflict"))["status"] == 409
+    assert (await asgi_get(app, "/storage"))["status"] == 500
+
+    assert [(record.http_status, record.exc_info is not None) for record in log_records] == [(409, False), (500, True)]
@@ -0,0 +1,89 @@
+"""Тесты фильтрации и навигации по спискам"""
+
+__author__: str = "Старков Е.П."
+
+import pytest
+
+from dh_platform.exceptions import InvalidFilter, InvalidNavigation
+from tests.conftest import UserCreate, UserService
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+async def users(engine):
+    return await UserService.create_many([UserCreate(name=f"user-{index}", age=20 + index) for index in range(10)])
+
+
+@pytest.mark.parametrize(
+    ("filters", "ages"),
+    [
+        ({"age": 21}, [21]),
+        ({"age__gte": 27}, [27, 28, 29]),
+        ({"age__range": (22, 24)}, [22, 23, 24]),
+        ({"age__range": [None, 21]}, [20, 21]),
+        ({"age__in": [20, 29]}, [20, 29]),
+        ({"age__not_in": {20, 21, 22, 23, 24, 25, 26}}, [27, 28, 29]),
+        ({"name__like": "user-1%", "age__lt": 25}, [21]),
+    ],
+)
+async def test_filters(users, filters, ages):
+    result = await UserService.list(filters, {"order_by": "id"})
+
+    assert [user.age for user in result] == ages
+
+
+@pytest.mark.parametrize(
+    "filters",
+    [
+        {"age__range": 5},
+        {"age__range": (1, 2, 3)},
+        {"age__range": "ab"},
+        {"age__in": 5},
+        {"age__in": "abc"},
+        {"age__not_in": None},
+        {"unknown": 1},
+    ],
+)
+async def test_invalid_filters(users, filters):
+    with pytest.raises(InvalidFilter):
+        await UserService.list(filters)
+
+
+async def test_keyset_pages(users):
+    ids: list[int] = []
+    cursor: str | None = None
+
+    while True:
+        page = await UserService.list_page(navigation={"limit": 3, "cursor": cursor, "order_by": "name"})
+        ids.extend(user.id for user in page.items)
+        cursor = page.next_cursor
+
+        if not page.has_more:
+            break
+
+    assert ids == [user.id for user in sorted(users, key=lambda user: user.name)]
+
+
+async def test_keyset_rejects_nullable_column(users):
+    with pytest.raises(InvalidNavigation):
+        await UserService.list_page(navigation={"limit": 3, "cursor": None, "order_by": "email"})
+
+    page = await UserService.list_page(navigation={"limit": 3, "order_by": "email"})
+
+    assert len(page.items) == 3
+    assert page.next_cursor is None
+
+
+async def test_offset_page_with_total(users):
+    page = await UserService.list_page(navigation={"page": 1, "limit": 4, "total": True})
+
+    assert [user.age for user in page.items] == [24, 25, 26, 27]
+    assert page.has_more
+    assert page.total == 10
+
+
+@pytest.mark.parametrize("navigation", [{"limit": 0}, {"page": -1}, {"order_by": "age"}, {"cursor": "???"}])
+async def test_invalid_navigation(users, navigation):
+    with pytest.raises(InvalidNavigation):
+        await UserService.list(navigation=navigation)
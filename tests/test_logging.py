@@ -0,0 +1,67 @@
+"""Тесты логирования через очередь"""
+
+__author__: str = "Старков Е.П."
+
+import logging
+import queue
+import threading
+import time
+
+from dh_platform.logging.handlers import BatchingQueueListener
+
+
+class CollectingHandler(logging.Handler):
+    def __init__(self, release: threading.Event | None = None) -> None:
+        super().__init__()
+        self.records: list[logging.LogRecord] = []
+        self._release: threading.Event | None = release
+
+    def emit(self, record: logging.LogRecord) -> None:
+        if self._release is not None:
+            self._release.wait(5)
+
+        self.records.append(record)
+
+
+def make_record(message: str) -> logging.LogRecord:
+    return logging.LogRecord("dh_logger", logging.INFO, __file__, 0, message, None, None)
+
+
+def test_records_after_sentinel_are_handled():
+    log_queue: queue.Queue = queue.Queue()
+    handler: CollectingHandler = CollectingHandler()
+    listener: BatchingQueueListener = BatchingQueueListener(log_queue, handler)
+
+    for item in (make_record("1"), make_record("2"), listener._sentinel, make_record("3")):
+        log_queue.put(item)
+
+    listener._monitor()
+
+    assert [record.getMessage() for record in handler.records] == ["1", "2", "3"]
+    assert log_queue.unfinished_tasks == 0
+
+
+def test_stop_with_full_queue():
+    release: threading.Event = threading.Event()
+    log_queue: queue.Queue = queue.Queue(2)
+    handler: CollectingHandler = CollectingHandler(release)
+    listener: BatchingQueueListener = BatchingQueueListener(log_queue, handler, batch_size=1)
+    listener.start()
+
+    log_queue.put(make_record("0"))
+
+    while log_queue.qsize():
+        time.sleep(0.001)
+
+    # Первая запись ожидает в обработчике, очередь заполнена
+    log_queue.put(make_record("1"))
+    log_queue.put(make_record("2"))
+    stopper: threading.Thread = threading.Thread(target=listener.stop)
+    stopper.start()
+    release.set()
+    stopper.join(5)
+
+    assert not stopper.is_alive()
+    assert listener._thread is None
+    assert len(handler.records) == 3
+    assert log_queue.unfinished_tasks == 0
@@ -0,0 +1,127 @@
+"""Тесты шины событий"""
+
+__author__: str = "Старков Е.П."
+
+import pytest
+from sqlalchemy import func, select
+
+from dh_platform.databases import (
+    get_current_session,
+    session_scope,
+    unit_of_work,
+)
+from dh_platform.logging import request_id_var
+from dh_platform.patterns.message_bus import DispatchMode, Event, MessageBus
+from dh_platform.patterns.message_bus.outbox import Outbox, OutboxMessage
+from tests.conftest import AuditCreate, AuditModel, AuditService
+
+pytestmark = pytest.mark.anyio
+
+
+class AuditEvent(Event):
+    action: str
+
+
+class OrderEvent(Event):
+    id: int
+    version: int
+
+
+def test_event_envelope_does_not_collide_with_domain_fields():
+    event: OrderEvent = OrderEvent(id=1, version=5)
+    caused: AuditEvent = event.caused(AuditEvent, action="paid")
+
+    assert (event.id, event.version, event.schema_version) == (1, 5, 1)
+    assert (caused.correlation_id, caused.causation_id) == (event.event_id, event.event_id)
+    assert event.event_id < caused.event_id
+    assert event.monotonic_ns <= caused.monotonic_ns
+    assert "monotonic_ns" not in event.model_dump()
+
+
+@pytest.mark.parametrize("mode", [None, DispatchMode.BACKGROUND])
+async def test_handlers_do_not_inherit_publisher_context(engine, mode):
+    bus: MessageBus = MessageBus(mode=mode or DispatchMode.SEQUENTIAL)
+    contexts: list[tuple] = []
+
+    async def handler(event: AuditEvent) -> None:
+        contexts.append((get_current_session(), request_id_var.get()))
+        await AuditService.create(AuditCreate(action=event.action))
+
+    bus.subscribe(AuditEvent, handler)
+    token = request_id_var.set("request-1")
+
+    try:
+        async with session_scope():
+            for index in range(4):
+                if mode is None:
+                    await bus.publish_nowait(AuditEvent(action=f"action-{index}"))
+                else:
+                    await bus.publish(AuditEvent(action=f"action-{index}"))
+    finally:
+        request_id_var.reset(token)
+
+    await bus.stop()
+
+    assert contexts == [(None, None)] * 4
+    assert len(await AuditService.list()) == 4
+
+
+async def test_outbox_delivery_waits_for_handlers():
+    bus: MessageBus = MessageBus(mode=DispatchMode.BACKGROUND)
+
+    async def handler(event: AuditEvent) -> None:
+        raise RuntimeError(event.action)
+
+    bus.subscribe(AuditEvent, handler)
+    outbox: Outbox = Outbox(bus)
+    event: AuditEvent = AuditEvent(action="create")
+    message: OutboxMessage = OutboxMessage(event_type=event.get_event_name(), payload=event.model_dump(mode="json"))
+
+    assert "RuntimeError('create')" == await outbox._deliver(message)
+
+    with pytest.raises(ValueError):
+        Outbox(bus, mode=DispatchMode.BACKGROUND)
+
+
+class OutboxAuditService(AuditService):
+    _OUTBOX: Outbox = Outbox()
+
+    @classmethod
+    async def _before_create(cls, create_data: dict) -> None:
+        await cls._OUTBOX.add(AuditEvent(action=create_data["action"]))
+
+        if create_data["action"] == "fail":
+            raise ValueError(create_data["action"])
+
+    @classmethod
+    async def _after_create(cls, entity_data: AuditModel, create_data: dict) -> None:
+        await cls._OUTBOX.add(AuditEvent(action=f"{create_data['action']}-after"))
+
+
+async def count_outbox() -> int:
+    async with session_scope() as session:
+        return await session.scalar(select(func.count()).select_from(OutboxMessage))
+
+
+async def test_outbox_add_joins_service_transaction(engine):
+    with pytest.raises(ValueError):
+        await OutboxAuditService.create(AuditCreate(action="fail"))
+
+    assert await count_outbox() == 0
+    assert await AuditService.count() == 0
+
+    await OutboxAuditService.create(AuditCreate(action="create"))
+
+    assert await count_outbox() == 2
+    assert await AuditService.count() == 1
+
+    with pytest.raises(ValueError):
+        async with unit_of_work():
+            await OutboxAuditService.create(AuditCreate(action="create"))
+            raise ValueError("rollback")
+
+    assert await count_outbox() == 2
+
+    await Outbox().add(AuditEvent(action="standalone"))
+
+    assert await count_outbox() == 3
@@ -0,0 +1,24 @@
+"""Тесты метрик"""
+
+__author__: str = "Старков Е.П."
+
+import pytest
+
+from dh_platform.metrics import count_rows
+from dh_platform.navigation import Page
+
+
+@pytest.mark.parametrize(
+    ("result", "rows"),
+    [
+        (None, 0),
+        (True, 0),
+        (1_000_000, 0),
+        (12.5, 0),
+        ([1, 2, 3], 3),
+        (Page(items=[1, 2]), 2),
+        (object(), 1),
+    ],
+)
+def test_count_rows(result, rows):
+    assert count_rows(result) == rows
@@ -0,0 +1,64 @@
+"""Тесты middleware логирования запросов"""
+
+__author__: str = "Старков Е.П."
+
+import logging
+from typing import Any
+
+import pytest
+from fastapi import FastAPI
+
+from dh_platform.logging import RequestLoggingMiddleware, request_id_var
+from tests.conftest import asgi_get
+
+pytestmark = pytest.mark.anyio
+
+
+def make_app() -> FastAPI:
+    app: FastAPI = FastAPI()
+
+    @app.get("/users/{user_id}")
+    async def read_user(user_id: int) -> dict[str, Any]:
+        logging.getLogger("dh_logger").info("Чтение пользователя %d", user_id)
+        return {"request_id": request_id_var.get()}
+
+    @app.get("/health")
+    async def health() -> dict[str, str]:
+        return {"status": "ok"}
+
+    return app
+
+
+async def test_request_id_propagation(log_records):
+    app: RequestLoggingMiddleware = RequestLoggingMiddleware(make_app())
+
+    response: dict[str, Any] = await asgi_get(app, "/users/1", [(b"x-request-id", b"request-1")])
+
+    assert response["headers"][b"x-request-id"] == b"request-1"
+    assert response["body"] == b'{"request_id":"request-1"}'
+    assert [record.getMessage() for record in log_records][0] == "Чтение пользователя 1"
+    assert log_records[1].http_route == "/users/{user_id}"
+    assert log_records[1].http_status == 200
+    assert request_id_var.get() is None
+
+    response = await asgi_get(app, "/users/2")
+
+    assert len(response["headers"][b"x-request-id"]) == 32
+
+
+async def test_sampling_and_excluded_paths(log_records, monkeypatch):
+    app: RequestLoggingMiddleware = RequestLoggingMiddleware(make_app(), sample_rate=0.5, exclude_paths=["/health"])
+
+    await asgi_get(app, "/health")
+    assert log_records == []
+
+    monkeypatch.setattr("dh_platform.logging.middleware.random.random", lambda: 0.9)
+    await asgi_get(app, "/users/1")
+    assert [record.getMessage() for record in log_records] == ["Чтение пользователя 1"]
+
+    await asgi_get(app, "/users/abc")
+    assert log_records[-1].http_status == 422
+
+    monkeypatch.setattr("dh_platform.logging.middleware.random.random", lambda: 0.1)
+    await asgi_get(app, "/users/1")
+    assert log_records[-1].http_status == 200
@@ -0,0 +1,140 @@
+"""Тесты базового сервиса"""
+
+__author__: str = "Старков Е.П."
+
+import pytest
+
+from dh_platform.databases import count_queries
+from dh_platform.exceptions import EntityNotFound, EntityVersionConflict
+from tests.conftest import (
+    DocumentCreate,
+    DocumentService,
+    DocumentUpdate,
+    UserCreate,
+    UserService,
+    UserUpdate,
+)
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_create_many_keeps_input_order(engine):
+    names: list[str] = [f"user-{index}" for index in range(25)]
+    hooked: list[tuple[str, str]] = []
+
+    class HookedUserService(UserService):
+        @classmethod
+        async def _after_create(cls, entity_data, create_data) -> None:
+            hooked.append((entity_data.name, create_data["name"]))
+
+    users = await HookedUserService.create_many([UserCreate(name=name) for name in names], chunk_size=10)
+
+    assert [user.name for user in users] == names
+    assert all(entity_name == data_name for entity_name, data_name in hooked)
+    assert len(hooked) == len(names)
+
+
+async def test_update_many(engine):
+    users = await UserService.create_many([UserCreate(name=f"user-{index}") for index in range(3)])
+
+    await UserService.update_many([UserUpdate(id=user.id, name=f"new-{user.id}", age=30) for user in users])
+
+    assert {(user.name, user.age) for user in await UserService.list()} == {(f"new-{user.id}", 30) for user in users}
+
+
+async def test_delete_many_soft_then_force(engine):
+    users = await UserService.create_many([UserCreate(name=f"user-{index}") for index in range(3)])
+    ids: list[int] = [user.id for user in users]
+
+    assert await UserService.delete_many(ids[:2]) == 2
+    users = await UserService.list(navigation={"order_by": "id"})
+    assert [user.deleted_at is not None for user in users] == [True, True, False]
+
+    assert await UserService.delete_many(ids) == 3
+    assert [user.id for user in await UserService.list(navigation={"order_by": "id"})] == [ids[2]]
+    assert (await UserService.read(ids[2])).deleted_at is not None
+
+
+async def test_bulk_methods_call_overridden_entity_hooks(engine):
+    hooked: list[tuple[str, int]] = []
+
+    class HookedUserService(UserService):
+        @classmethod
+        async def _before_update(cls, data_dict, old_data) -> None:
+            hooked.append(("update", old_data.id))
+
+        @classmethod
+        async def _after_delete(cls, entity_data) -> None:
+            hooked.append(("delete", entity_data.id))
+
+    users = await HookedUserService.create_many([UserCreate(name=f"user-{index}") for index in range(3)])
+    ids: list[int] = [user.id for user in users]
+
+    await HookedUserService.update_many([UserUpdate(id=user.id, name=f"new-{user.id}") for user in users])
+
+    assert hooked == [("update", entity_id) for entity_id in ids]
+    assert {user.name for user in await UserService.list()} == {f"new-{entity_id}" for entity_id in ids}
+
+    hooked.clear()
+
+    assert await HookedUserService.delete_many([*ids, 0]) == 3
+    assert hooked == [("delete", entity_id) for entity_id in ids]
+    assert all(user.deleted_at is not None for user in await UserService.list())
+
+
+async def test_get_one_by_filter_on_column_named_like_parameter(engine):
+    await UserService.create_many([UserCreate(name="Иван", profile="admin"), UserCreate(name="Петр", profile="user")])
+
+    assert (await UserService.get_one_by_filter(profile="user")).name == "Петр"
+    assert (await UserService.get_one_by_filter(profile="admin", _fields=("name",))) == ("Иван",)
+
+
+async def test_aggregate(engine):
+    await UserService.create_many(
+        [UserCreate(name=name, age=age) for name, age in (("Иван", 20), ("Иван", 30), ("Петр", 40))]
+    )
+
+    result = await UserService.aggregate(group_by=["name"], sum_of=["age"], min_of=["age"], max_of=["age"])
+
+    assert result == [
+        {"name": "Иван", "count": 2, "sum_age": 50, "min_age": 20, "max_age": 30},
+        {"name": "Петр", "count": 1, "sum_age": 40, "min_age": 40, "max_age": 40},
+    ]
+
+
+async def test_fast_update(engine):
+    document = await DocumentService.create(DocumentCreate(title="Черновик"))
+
+    with count_queries() as counter:
+        updated = await DocumentService.update(DocumentUpdate(id=document.id, version=1))
+
+    assert (updated.title, updated.version) == ("Черновик", 2)
+    assert counter.count == 1
+
+    with pytest.raises(EntityVersionConflict):
+        await DocumentService.update(DocumentUpdate(id=document.id, title="Устаревшая", version=1))
+
+    with pytest.raises(EntityNotFound):
+        await DocumentService.update(DocumentUpdate(id=0, title="Новая"))
+
+    updated = await DocumentService.update(DocumentUpdate(id=document.id, title="Итоговая"))
+
+    assert (updated.title, updated.version) == ("Итоговая", 3)
+
+
+async def test_update_falls_back_when_before_update_is_overridden(engine):
+    hooked: list[int] = []
+
+    class HookedDocumentService(DocumentService):
+        @classmethod
+        async def _before_update(cls, data_dict, old_data) -> None:
+            hooked.append(old_data.version)
+
+    document = await HookedDocumentService.create(DocumentCreate(title="Черновик"))
+    updated = await HookedDocumentService.update(DocumentUpdate(id=document.id, title="Итоговая", version=1))
+
+    assert (updated.title, updated.version) == ("Итоговая", 2)
+    assert hooked == [1]
+
+    with pytest.raises(EntityVersionConflict):
+        await HookedDocumentService.update(DocumentUpdate(id=document.id, title="Устаревшая", version=1))
@@ -0,0 +1,62 @@
+"""Тесты транспорта событий"""
+
+__author__: str = "Старков Е.П."
+
+import pytest
+
+from dh_platform.logging import request_id_var
+from dh_platform.patterns.message_bus import Event, MessageBus
+from dh_platform.patterns.message_bus.transport import (
+    LoopbackTransport,
+    deserialize_events,
+    serialize_events,
+)
+
+pytestmark = pytest.mark.anyio
+
+
+class TransportEvent(Event):
+    value: str
+
+
+async def test_loopback_transport_delivers_to_all_buses():
+    bus_a: MessageBus = MessageBus(transport=LoopbackTransport(channel="test"))
+    bus_b: MessageBus = MessageBus(transport=LoopbackTransport(channel="test"))
+    received: dict[str, list[tuple]] = {"a": [], "b": []}
+
+    for name, bus in (("a", bus_a), ("b", bus_b)):
+
+        async def handler(event: TransportEvent, name: str = name) -> None:
+            received[name].append((event.event_id, event.value, request_id_var.get()))
+
+        bus.subscribe(TransportEvent, handler)
+        await bus.start()
+
+    events: list[TransportEvent] = [TransportEvent(value=str(index)) for index in range(3)]
+    token = request_id_var.set("request-1")
+
+    try:
+        for event in events:
+            await bus_a.broadcast(event)
+    finally:
+        request_id_var.reset(token)
+
+    await bus_a.stop()
+    await bus_b.stop()
+
+    expected: list[tuple] = [(event.event_id, event.value, None) for event in events]
+    assert received == {"a": expected, "b": expected}
+    assert LoopbackTransport._channels["test"] == []
+
+
+def test_serialize_events_splits_messages_by_size():
+    events: list[TransportEvent] = [TransportEvent(value="x" * 10) for _ in range(5)]
+    line_size: int = max(len(serialize_events([event])[0].encode()) for event in events)
+
+    messages: list[str] = serialize_events(events, max_size=line_size * 2 + 1)
+
+    assert len(messages) == 3
+    assert all(len(message.encode()) <= line_size * 2 + 1 for message in messages)
+    restored: list[Event] = [event for message in messages for event in deserialize_events(message)]
+    assert [event.model_dump() for event in restored] == [event.model_dump() for event in events]
+    assert serialize_events([TransportEvent(value="x" * 100)], max_size=line_size) == []